@@ -0,0 +1,288 @@
+"""
+This script benchmarks each step of a simulated day on synthetic
+enclosures of growing sizes, and writes the results to a JSON file so that
+they can be compared across commits.
+
+Usage: python -m benchmarks.bench_day_step --sizes 1000 10000 \
+    --output bench_day_step.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+import utils
+from entities.columnar_enclosure import ColumnarEnclosure
+from entities.enclosure import Enclosure
+from entities.living_being import Animal, Plant
+from services.enclosure_service import (
+    let_animals_eat,
+    make_living_beings_breed,
+    make_living_beings_spend_some_time,
+    move_forward_to_next_day,
+    remove_dead_living_entities_from_enclosure,
+    report_enclosure_state,
+)
+from services.event_service import NullEventSink, use_event_sink
+from utils import (
+    LIVING_BEING_MAX_AGE,
+    AnimalSpecieEnum,
+    LivingBeingStateEnum,
+    PlantspecieEnum,
+    genderEnum,
+)
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+BACKENDS = {
+    "enclosure": Enclosure,
+    "columnar": ColumnarEnclosure,
+}
+
+STEPS = {
+    "make_living_beings_spend_some_time": make_living_beings_spend_some_time,
+    "make_living_beings_breed": make_living_beings_breed,
+    "let_animals_eat": let_animals_eat,
+    "remove_dead_living_entities_from_enclosure":
+        remove_dead_living_entities_from_enclosure,
+    "report_enclosure_state": report_enclosure_state,
+    "move_forward_to_next_day": move_forward_to_next_day,
+}
+
+
+def generate_enclosure(
+    size: int,
+    backend: str = "enclosure",
+    plant_ratio: float = 0.5,
+    specie_weights: Dict[str, float] = None,
+    dead_ratio: float = 0.0,
+    seed: int = 0,
+) -> Enclosure:
+    """
+    Generate an enclosure of `size` living beings.
+
+    Parameters
+    ----------
+        size: int
+            Number of animals and plants
+        backend: str
+            One of BACKENDS keys
+        plant_ratio: float
+            Share of plants in the population
+        specie_weights: Dict[str, float]
+            Relative weight of each animal specie, all species are equally
+            likely by default. The diet mix follows from it.
+        dead_ratio: float
+            Share of living beings already dead
+        seed: int
+
+    Returns
+    -------
+    Enclosure
+    """
+    rng = random.Random(seed)
+    enclosure = BACKENDS[backend](rng=random.Random(seed))
+    specie_weights = specie_weights or {
+        specie: 1 for specie in AnimalSpecieEnum.values_list()
+    }
+    species = list(specie_weights)
+    weights = [specie_weights[specie] for specie in species]
+
+    plants_count = int(size * plant_ratio)
+    animals_count = size - plants_count
+    animals = []
+    for idx, specie in enumerate(
+        rng.choices(species, weights=weights, k=animals_count)
+    ):
+        animal = Animal(
+            name=f"{specie} {idx}",
+            gender=rng.choice(genderEnum.values_tuple()),
+            specie=specie,
+            rng=rng,
+        )
+        animal.set_life_points(rng.randint(1, 10))
+        if rng.random() < dead_ratio:
+            animal.set_state(LivingBeingStateEnum.DEAD.value)
+        animals.append(animal)
+
+    plants = []
+    for _ in range(plants_count):
+        plant = Plant(specie=PlantspecieEnum.SEAWEED.value, rng=rng)
+        plant.set_life_points(rng.randint(1, 12))
+        plant.set_age(rng.randint(0, LIVING_BEING_MAX_AGE))
+        if rng.random() < dead_ratio:
+            plant.set_state(LivingBeingStateEnum.DEAD.value)
+        plants.append(plant)
+
+    enclosure.set_animals(animals)
+    enclosure.set_plants(plants)
+    return enclosure
+
+
+def measure(
+    step: Callable, build_enclosure: Callable, repeat: int, memory: bool
+) -> dict:
+    """
+    Time a step on freshly built enclosures, keeping the best time, then
+    measure its peak memory in a separate run when asked.
+    """
+    timings = []
+    for _ in range(repeat):
+        enclosure = build_enclosure()
+        start = time.perf_counter()
+        step(enclosure)
+        timings.append(time.perf_counter() - start)
+
+    peak_memory = None
+    if memory:
+        enclosure = build_enclosure()
+        tracemalloc.start()
+        step(enclosure)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {"seconds": min(timings), "peak_memory_bytes": peak_memory}
+
+
+def get_commit() -> str:
+    """Return the current git commit, if any."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(
+    sizes: List[int],
+    backends: List[str],
+    steps: List[str],
+    repeat: int = 1,
+    memory: bool = True,
+    plant_ratio: float = 0.5,
+    specie_weights: Dict[str, float] = None,
+    seed: int = 0,
+) -> dict:
+    """
+    Run every requested step for each size and backend.
+
+    Returns
+    -------
+    dict
+        Run details and one result per size, backend and step
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as log_dir, \
+            use_event_sink(NullEventSink()):
+        # Keep the reports of the benchmark away from the real ones
+        log_report_path = utils.LOG_REPORT_PATH
+        utils.LOG_REPORT_PATH = os.path.join(log_dir, "report.txt")
+        try:
+            for size in sizes:
+                for backend in backends:
+                    def build_enclosure():
+                        return generate_enclosure(
+                            size=size,
+                            backend=backend,
+                            plant_ratio=plant_ratio,
+                            specie_weights=specie_weights,
+                            seed=seed,
+                        )
+
+                    for step in steps:
+                        result = measure(
+                            STEPS[step], build_enclosure, repeat, memory
+                        )
+                        results.append(
+                            {
+                                "size": size,
+                                "backend": backend,
+                                "step": step,
+                                **result,
+                            }
+                        )
+                        print(
+                            f"{size:>9} {backend:<10} {step:<43} "
+                            f"{result['seconds']:.4f}s"
+                        )
+        finally:
+            utils.LOG_REPORT_PATH = log_report_path
+
+    return {
+        "commit": get_commit(),
+        "python": platform.python_version(),
+        "plant_ratio": plant_ratio,
+        "specie_weights": specie_weights,
+        "seed": seed,
+        "results": results,
+    }
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=DEFAULT_SIZES
+    )
+    parser.add_argument(
+        "--backends", nargs="+", choices=list(BACKENDS), default=["enclosure"]
+    )
+    parser.add_argument(
+        "--steps", nargs="+", choices=list(STEPS), default=list(STEPS)
+    )
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="Skip the peak memory measure, which runs each step again.",
+    )
+    parser.add_argument("--plant-ratio", type=float, default=0.5)
+    parser.add_argument(
+        "--species",
+        nargs="+",
+        metavar="SPECIE=WEIGHT",
+        help="Animal species mix, eg: lion=1 antelope=10",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="bench_day_step.json")
+    return parser
+
+
+def main(argv: List[str] = None) -> None:
+    args = get_parser().parse_args(argv)
+    specie_weights = None
+    if args.species:
+        specie_weights = {}
+        for item in args.species:
+            specie, weight = item.split("=")
+            if specie not in AnimalSpecieEnum.values_set():
+                raise ValueError(f"Unknown specie `{specie}`.")
+            specie_weights[specie] = float(weight)
+
+    report = run_benchmarks(
+        sizes=args.sizes,
+        backends=args.backends,
+        steps=args.steps,
+        repeat=args.repeat,
+        memory=not args.no_memory,
+        plant_ratio=args.plant_ratio,
+        specie_weights=specie_weights,
+        seed=args.seed,
+    )
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
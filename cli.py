@@ -0,0 +1,198 @@
+"""
+This script is the headless entry for the project.
+It runs simulations in batch, without any user interaction.
+
+Usage: python cli.py run --config data/config.yaml --days 10000 --seed 42
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import List
+
+from entities.columnar_enclosure import ColumnarEnclosure
+from entities.enclosure import Enclosure
+from repositories.enclosure_repository import (
+    load_enclosure_data_from_file,
+    save_enclosure_data_to_file,
+)
+from services.enclosure_service import move_forward_to_next_day
+from services.event_service import (
+    ConsoleEventSink,
+    EventSink,
+    JsonlEventSink,
+    NullEventSink,
+    use_event_sink,
+)
+from utils import CONFIG_FILENAME, FeedingEngineEnum
+
+
+def get_snapshot_path(snapshot_dir: str, day: int) -> str:
+    """Return the path of the snapshot written after the given day."""
+    return os.path.join(snapshot_dir, f"day-{day:08d}.yaml")
+
+
+def run_simulation(
+    enclosure: Enclosure,
+    days: int,
+    snapshot_every: int = 0,
+    snapshot_dir: str = "snapshots",
+    feeding_engine: str = FeedingEngineEnum.QUEUED.value,
+) -> Enclosure:
+    """
+    Move the given enclosure forward for a number of days, saving a
+    snapshot every `snapshot_every` days when it is not 0.
+
+    Parameters
+    ----------
+        enclosure: Enclosure
+        days: int
+        snapshot_every: int
+        snapshot_dir: str
+        feeding_engine: str
+
+    Returns
+    -------
+    Enclosure
+    """
+    if days is None or not isinstance(days, int) or days < 0:
+        raise ValueError("`days` should be a positive integer.")
+    if snapshot_every is None or not isinstance(snapshot_every, int) or \
+            snapshot_every < 0:
+        raise ValueError("`snapshot_every` should be a positive integer.")
+
+    if snapshot_every:
+        os.makedirs(snapshot_dir, exist_ok=True)
+
+    for day in range(1, days + 1):
+        enclosure = move_forward_to_next_day(
+            enclosure=enclosure, feeding_engine=feeding_engine
+        )
+        if snapshot_every and day % snapshot_every == 0:
+            save_enclosure_data_to_file(
+                enclosure=enclosure,
+                path=get_snapshot_path(snapshot_dir, day),
+            )
+    return enclosure
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="cli.py", description="Zoo simulator batch runner."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser(
+        "run", help="Move an enclosure forward for a number of days."
+    )
+    run_parser.add_argument(
+        "--config",
+        default=CONFIG_FILENAME,
+        help=f"Enclosure config file to start from (default: "
+        f"{CONFIG_FILENAME}).",
+    )
+    run_parser.add_argument(
+        "--days", type=int, required=True, help="Number of days to run."
+    )
+    run_parser.add_argument(
+        "--seed", type=int, default=None, help="Random seed of the run."
+    )
+    run_parser.add_argument(
+        "--snapshot-every",
+        type=int,
+        default=0,
+        help="Save a snapshot every N days (default: never).",
+    )
+    run_parser.add_argument(
+        "--snapshot-dir",
+        default="snapshots",
+        help="Directory of the snapshots (default: snapshots).",
+    )
+    run_parser.add_argument(
+        "--feeding-engine",
+        choices=FeedingEngineEnum.values_list(),
+        default=FeedingEngineEnum.QUEUED.value,
+    )
+    run_parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="Store the enclosure in typed arrays.",
+    )
+    run_parser.add_argument(
+        "--events",
+        choices=["console", "none", "jsonl"],
+        default="console",
+        help="Where to send what happens in the enclosure (default: "
+        "console). jsonl requires --events-file.",
+    )
+    run_parser.add_argument(
+        "--events-file", help="File of the jsonl events."
+    )
+    run_parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Same as --events none.",
+    )
+    return parser
+
+
+def get_event_sink_from_args(args: argparse.Namespace) -> EventSink:
+    """Build the event sink requested on the command line."""
+    if args.quiet or args.events == "none":
+        return NullEventSink()
+    if args.events == "jsonl":
+        if not args.events_file:
+            raise ValueError("--events jsonl requires --events-file.")
+        return JsonlEventSink(path=args.events_file)
+    return ConsoleEventSink()
+
+
+def run_command(args: argparse.Namespace) -> None:
+    """Load the enclosure, run it and print the throughput."""
+    # Everything random in the run comes from the enclosure generator
+    rng = random.Random(args.seed)
+    enclosure = load_enclosure_data_from_file(
+        enclosure=ColumnarEnclosure(rng=rng) if args.columnar
+        else Enclosure(rng=rng),
+        path=args.config,
+    )
+
+    sink = get_event_sink_from_args(args)
+    start = time.perf_counter()
+    try:
+        with use_event_sink(sink):
+            enclosure = run_simulation(
+                enclosure=enclosure,
+                days=args.days,
+                snapshot_every=args.snapshot_every,
+                snapshot_dir=args.snapshot_dir,
+                feeding_engine=args.feeding_engine,
+            )
+    finally:
+        sink.close()
+    elapsed = time.perf_counter() - start
+
+    days_per_second = args.days / elapsed if elapsed else float("inf")
+    print(
+        f"{args.days} day(s) in {elapsed:.3f}s ({days_per_second:.1f} "
+        f"days/s): {len(enclosure.get_animals())} animal(s) and "
+        f"{len(enclosure.get_plants())} plant(s) left."
+    )
+
+
+def main(argv: List[str] = None) -> int:
+    """Parse the command line and run the requested command."""
+    args = get_parser().parse_args(argv)
+    try:
+        if args.command == "run":
+            run_command(args)
+    except (FileNotFoundError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,556 @@
+"""
+This class contains a columnar (struct-of-arrays) Enclosure backend.
+
+Each attribute of the living beings is kept in its own typed array and enum
+values are stored as small integer codes. Animal and Plant objects handed
+out by this enclosure are lightweight views over a row of those arrays,
+created on demand.
+"""
+
+import random
+from array import array
+from typing import List
+
+from entities.enclosure import Enclosure
+from entities.living_being import Animal, Plant
+from utils import (
+    ANIMAL_SPECIE_DIET_MAP,
+    LIVING_BEING_MAX_AGE,
+    AnimalSpecieEnum,
+    DietEnum,
+    LivingBeingStateEnum,
+    PlantspecieEnum,
+    genderEnum,
+)
+
+# Codes tables, the code of a value is its rank in the enum
+STATES = LivingBeingStateEnum.values_tuple()
+STATE_CODES = LivingBeingStateEnum.codes_map()
+GENDERS = genderEnum.values_tuple()
+GENDER_CODES = genderEnum.codes_map()
+DIETS = DietEnum.values_tuple()
+DIET_CODES = DietEnum.codes_map()
+ANIMAL_SPECIES = AnimalSpecieEnum.values_tuple()
+ANIMAL_SPECIE_CODES = AnimalSpecieEnum.codes_map()
+PLANT_SPECIES = PlantspecieEnum.values_tuple()
+PLANT_SPECIE_CODES = PlantspecieEnum.codes_map()
+
+# Diet code of each animal specie code
+ANIMAL_SPECIE_DIET_CODES = tuple(
+    DIET_CODES[ANIMAL_SPECIE_DIET_MAP[specie]] for specie in ANIMAL_SPECIES
+)
+
+
+class NameTable:
+    """
+    Store each distinct animal name once and refer to it by an integer id.
+    """
+
+    def __init__(self) -> None:
+        self._names = []
+        self._ids = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def get_id(self, name: str) -> int:
+        """Return the id of the given name, registering it if needed."""
+        name_id = self._ids.get(name)
+        if name_id is None:
+            name_id = len(self._names)
+            self._names.append(name)
+            self._ids[name] = name_id
+        return name_id
+
+    def get_name(self, name_id: int) -> str:
+        """Return the name registered under the given id."""
+        return self._names[name_id]
+
+
+class PlantColumns:
+    """
+    Typed arrays holding one attribute of every plant each.
+    """
+
+    # Column attribute name and its array typecode
+    COLUMNS = {
+        "ages": "b",
+        "life_points": "i",
+        "states": "b",
+        "species": "b",
+    }
+
+    def __init__(self) -> None:
+        for column, typecode in self.COLUMNS.items():
+            setattr(self, column, array(typecode))
+
+    def __len__(self) -> int:
+        return len(self.ages)
+
+    def new(self) -> "PlantColumns":
+        """Return empty columns of the same kind."""
+        return self.__class__()
+
+    def append(
+        self, specie: int, age: int, life_points: int, state: int
+    ) -> None:
+        """Append a row of already encoded values."""
+        self.ages.append(age)
+        self.life_points.append(life_points)
+        self.states.append(state)
+        self.species.append(specie)
+
+    def append_row_from(self, columns: "PlantColumns", position: int) -> None:
+        """Copy the row found at `position` in other columns of same kind."""
+        for column in self.COLUMNS:
+            getattr(self, column).append(getattr(columns, column)[position])
+
+    def select(self, positions: List[int]) -> "PlantColumns":
+        """
+        Return new columns made of the rows at the given positions.
+
+        Parameters
+        ----------
+            positions: List[int]
+
+        Returns
+        -------
+        PlantColumns
+        """
+        selected = self.new()
+        for column, typecode in self.COLUMNS.items():
+            values = getattr(self, column)
+            setattr(
+                selected,
+                column,
+                array(typecode, [values[idx] for idx in positions]),
+            )
+        return selected
+
+    def copy(self) -> "PlantColumns":
+        """Return a copy of these columns."""
+        copied = self.new()
+        for column in self.COLUMNS:
+            setattr(copied, column, getattr(self, column)[:])
+        return copied
+
+
+class AnimalColumns(PlantColumns):
+    """
+    Typed arrays holding one attribute of every animal each.
+    Names are stored as ids of the shared NameTable.
+    """
+
+    COLUMNS = {
+        **PlantColumns.COLUMNS,
+        "genders": "b",
+        "diets": "b",
+        "names": "I",
+    }
+
+    def __init__(self, name_table: NameTable) -> None:
+        super(AnimalColumns, self).__init__()
+        self.name_table = name_table
+
+    def new(self) -> "AnimalColumns":
+        return self.__class__(self.name_table)
+
+    def append(
+        self,
+        specie: int,
+        age: int,
+        life_points: int,
+        state: int,
+        gender: int,
+        name: str,
+    ) -> None:
+        """Append a row of already encoded values, except for the name."""
+        super(AnimalColumns, self).append(specie, age, life_points, state)
+        self.genders.append(gender)
+        self.diets.append(ANIMAL_SPECIE_DIET_CODES[specie])
+        self.names.append(self.name_table.get_id(name))
+
+
+def age_columns(columns: PlantColumns, life_points_delta: int) -> List[int]:
+    """
+    Make every row of the given columns spend a day at once: life points
+    change by `life_points_delta` and rows get one day older, unless they
+    have reached the maximum age in which case they die.
+
+    Parameters
+    ----------
+        columns: PlantColumns
+            Plant or animal columns
+        life_points_delta: int
+
+    Returns
+    -------
+    List[int]
+        Positions of the rows which died of old age
+    """
+    life_points = columns.life_points
+    if life_points_delta < 0 and life_points and \
+            min(life_points) + life_points_delta < 0:
+        raise ValueError("`life_points` should be a an integer value")
+
+    ages = columns.ages
+    dead_of_old_age = [
+        idx for idx, age in enumerate(ages) if age == LIVING_BEING_MAX_AGE
+    ]
+    columns.life_points = array(
+        life_points.typecode,
+        [points + life_points_delta for points in life_points],
+    )
+    ages = columns.ages = array(ages.typecode, [age + 1 for age in ages])
+
+    # Those who reached the maximum age die instead of getting older
+    dead_code = STATE_CODES[LivingBeingStateEnum.DEAD.value]
+    states = columns.states
+    for idx in dead_of_old_age:
+        ages[idx] = LIVING_BEING_MAX_AGE
+        states[idx] = dead_code
+    return dead_of_old_age
+
+
+class LivingBeingView:
+    """
+    Common behaviour of living beings views: attributes are read from and
+    written to a row of columns instead of the object itself.
+
+    A view is bound to the columns it was created from. Once the enclosure
+    content is replaced (eg: through set_animals), existing views keep
+    reading the previous columns.
+    """
+
+    __slots__ = ()
+
+    @property
+    def state(self) -> str:
+        return STATES[self._columns.states[self._position]]
+
+    @property
+    def life_points(self) -> int:
+        return self._columns.life_points[self._position]
+
+    @property
+    def age(self) -> int:
+        return self._columns.ages[self._position]
+
+    def set_state(self, state: str) -> None:
+        self.check_state(state)
+        self._columns.states[self._position] = STATE_CODES[state]
+
+    def set_life_points(self, life_points: int) -> None:
+        self.check_life_points(life_points)
+        self._columns.life_points[self._position] = life_points
+
+    def set_age(self, age: int) -> None:
+        self.check_age(age)
+        self._columns.ages[self._position] = age
+
+
+class PlantView(LivingBeingView, Plant):
+    """Plant stored in a row of PlantColumns."""
+
+    __slots__ = ("_columns", "_position")
+
+    def __init__(self, columns: PlantColumns, position: int) -> None:
+        self._columns = columns
+        self._position = position
+
+    @property
+    def specie(self) -> str:
+        return PLANT_SPECIES[self._columns.species[self._position]]
+
+
+class AnimalView(LivingBeingView, Animal):
+    """Animal stored in a row of AnimalColumns."""
+
+    __slots__ = ("_columns", "_position")
+
+    def __init__(self, columns: AnimalColumns, position: int) -> None:
+        self._columns = columns
+        self._position = position
+
+    @property
+    def name(self) -> str:
+        return self._columns.name_table.get_name(
+            self._columns.names[self._position]
+        )
+
+    @property
+    def gender(self) -> str:
+        return GENDERS[self._columns.genders[self._position]]
+
+    @property
+    def diet(self) -> str:
+        return DIETS[self._columns.diets[self._position]]
+
+    @property
+    def specie(self) -> str:
+        return ANIMAL_SPECIES[self._columns.species[self._position]]
+
+
+class ColumnarEnclosure(Enclosure):
+    """
+    Enclosure storing its living beings in typed arrays.
+
+    It offers the same API as Enclosure, and also gives access to the
+    columns themselves for bulk operations.
+    """
+
+    def __init__(self, rng: random.Random = None) -> None:
+        """
+        Initialize the enclosure object with empty columns.
+
+        Parameters
+        ----------
+            rng: random.Random
+
+        Returns
+        -------
+        None
+        """
+        self.set_rng(rng if rng is not None else random.Random())
+        self._name_table = NameTable()
+        self._animal_columns = AnimalColumns(self._name_table)
+        self._plant_columns = PlantColumns()
+
+    @classmethod
+    def from_enclosure(cls, enclosure: Enclosure) -> "ColumnarEnclosure":
+        """
+        Build a columnar copy of any enclosure.
+
+        Parameters
+        ----------
+            enclosure: Enclosure
+
+        Returns
+        -------
+        ColumnarEnclosure
+        """
+        columnar = cls(rng=enclosure.get_rng())
+        columnar.set_animals(enclosure.get_animals())
+        columnar.set_plants(enclosure.get_plants())
+        return columnar
+
+    def get_animal_columns(self) -> AnimalColumns:
+        """Retrieve the columns holding the enclosure's animals"""
+        return self._animal_columns
+
+    def get_plant_columns(self) -> PlantColumns:
+        """Retrieve the columns holding the enclosure's plants"""
+        return self._plant_columns
+
+    def set_animal_columns(self, columns: AnimalColumns) -> None:
+        """
+        Replace the columns holding the enclosure's animals.
+
+        Parameters
+        ----------
+            columns: AnimalColumns
+
+        Returns
+        -------
+        None
+        """
+        if not isinstance(columns, AnimalColumns) or \
+                columns.name_table is not self._name_table:
+            raise ValueError(
+                "`columns` should be AnimalColumns of this enclosure."
+            )
+        self._animal_columns = columns
+
+    def set_plant_columns(self, columns: PlantColumns) -> None:
+        """
+        Replace the columns holding the enclosure's plants.
+
+        Parameters
+        ----------
+            columns: PlantColumns
+
+        Returns
+        -------
+        None
+        """
+        if not isinstance(columns, PlantColumns) or \
+                isinstance(columns, AnimalColumns):
+            raise ValueError("`columns` should be PlantColumns.")
+        self._plant_columns = columns
+
+    def get_plants(self) -> List[Plant]:
+        """Retrieve list of views over the enclosure's plants"""
+        columns = self._plant_columns
+        return [PlantView(columns, idx) for idx in range(len(columns))]
+
+    def get_animals(self) -> List[Animal]:
+        """Retrieve list of views over the enclosure's animals"""
+        columns = self._animal_columns
+        return [AnimalView(columns, idx) for idx in range(len(columns))]
+
+    def append_animal(
+        self,
+        name: str,
+        gender: str,
+        specie: str,
+        age: int,
+        life_points: int,
+        state: str,
+    ) -> None:
+        """
+        Append an animal from its raw values, without building any object.
+        Values are expected to be valid.
+
+        Parameters
+        ----------
+            name: str
+            gender: str
+            specie: str
+            age: int
+            life_points: int
+            state: str
+
+        Returns
+        -------
+        None
+        """
+        self._animal_columns.append(
+            specie=ANIMAL_SPECIE_CODES[specie],
+            age=age,
+            life_points=life_points,
+            state=STATE_CODES[state],
+            gender=GENDER_CODES[gender],
+            name=name,
+        )
+
+    def append_plant(
+        self, specie: str, age: int, life_points: int, state: str
+    ) -> None:
+        """
+        Append a plant from its raw values, without building any object.
+        Values are expected to be valid.
+
+        Parameters
+        ----------
+            specie: str
+            age: int
+            life_points: int
+            state: str
+
+        Returns
+        -------
+        None
+        """
+        self._plant_columns.append(
+            specie=PLANT_SPECIE_CODES[specie],
+            age=age,
+            life_points=life_points,
+            state=STATE_CODES[state],
+        )
+
+    def add_animal(self, animal: Animal) -> None:
+        """
+        Add an animal to the enclosure.
+
+        Parameters
+        ----------
+            animal: Animal
+
+        Returns
+        -------
+        None
+        """
+        # Validate parameter value
+        if animal is None or not isinstance(animal, Animal):
+            raise ValueError("`animal` should be a valid instance of Animal.")
+
+        self.append_animal(
+            name=animal.name,
+            gender=animal.gender,
+            specie=animal.specie,
+            age=animal.age,
+            life_points=animal.life_points,
+            state=animal.state,
+        )
+
+    def add_plant(self, plant: Plant) -> None:
+        """
+        Add a new plant to the enclosure.
+
+        Parameters
+        ----------
+            plant: Plant
+
+        Returns
+        -------
+        None
+        """
+        # Validate plant object value
+        if plant is None or not isinstance(plant, Plant):
+            raise ValueError("`plant` should be a valid instance of Plant.")
+
+        self.append_plant(
+            specie=plant.specie,
+            age=plant.age,
+            life_points=plant.life_points,
+            state=plant.state,
+        )
+
+    def set_animals(self, animals: List[Animal]) -> None:
+        """
+        Set the complete list of animals. Views over the current columns are
+        copied row by row, other animals are encoded.
+
+        Parameters
+        ----------
+            animals: List[Animal]
+
+        Returns
+        -------
+        None
+        """
+        # Validate parameter value
+        if animals is None or \
+                any(not isinstance(animal, Animal) for animal in animals):
+            raise ValueError(
+                "`animals` should be a list of valid instances of Animal."
+            )
+
+        current = self._animal_columns
+        self._animal_columns = current.new()
+        for animal in animals:
+            if isinstance(animal, AnimalView) and animal._columns is current:
+                self._animal_columns.append_row_from(
+                    current, animal._position
+                )
+            else:
+                self.add_animal(animal)
+
+    def set_plants(self, plants: List[Plant]) -> None:
+        """
+        Set the complete list of plants. Views over the current columns are
+        copied row by row, other plants are encoded.
+
+        Parameters
+        ----------
+            plants: List[Plant]
+
+        Returns
+        -------
+        None
+        """
+        # Validate parameter value
+        if plants is None or \
+                any(not isinstance(plant, Plant) for plant in plants):
+            raise ValueError(
+                "`plants` should be a list of valid instances of Plant."
+            )
+
+        current = self._plant_columns
+        self._plant_columns = current.new()
+        for plant in plants:
+            if isinstance(plant, PlantView) and plant._columns is current:
+                self._plant_columns.append_row_from(current, plant._position)
+            else:
+                self.add_plant(plant)
+
@@ -2,6 +2,7 @@
 This class contains the Enclosure entity definition.
 """
 
+import random
 from typing import List
 from entities.living_being import Animal, Plant
 
@@ -12,10 +13,16 @@ class Enclosure:
 
     """
 
-    def __init__(self) -> None:
+    def __init__(self, rng: random.Random = None) -> None:
         """
         Initialize the enclosure object with required attributes.
 
+        Parameters
+        ----------
+            rng: random.Random
+                Generator of everything random happening in the enclosure.
+                A new unseeded one is created when none is given.
+
         Returns
         -------
         None
@@ -23,6 +30,27 @@ class Enclosure:
         # initialize animals and plants properties list
         self._animals = []
         self._plants = []
+        self.set_rng(rng if rng is not None else random.Random())
+
+    def get_rng(self) -> random.Random:
+        """Retrieve the random generator of the enclosure"""
+        return self._rng
+
+    def set_rng(self, rng: random.Random) -> None:
+        """
+        Set the random generator of the enclosure
+
+        Parameters
+        ----------
+            rng: random.Random
+
+        Returns
+        -------
+        None
+        """
+        if rng is None or not isinstance(rng, random.Random):
+            raise ValueError("`rng` should be an instance of random.Random.")
+        self._rng = rng
 
     def get_plants(self) -> List[Plant]:
         """Retrieve list of enclosure's plants"""
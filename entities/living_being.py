@@ -5,8 +5,11 @@ in an enclosure (animals and plants) and their initialization.
 
 
 import random
+import sys
+from typing import List
 from utils import (
-    AnimalSpecieDietEnum,
+    ANIMAL_SPECIE_DIET_MAP,
+    LIVING_BEING_MAX_AGE,
     PlantspecieEnum,
     genderEnum,
     AnimalSpecieEnum,
@@ -22,12 +25,25 @@ class LivingBeing:
     ----------
     state: str
         The living being state (alive or dead)
+
+    Attributes are declared as slots to keep instances compact, enum values
+    are stored as the shared enum value strings.
     """
 
-    def __init__(self) -> None:
+    __slots__ = ("_state", "_life_points", "_age")
+
+    def __init__(self, rng: random.Random = None, age: int = None) -> None:
         """
         Initialize the living being object.
 
+        Parameters
+        ----------
+            rng: random.Random
+                Generator drawing the initial age, defaults to the global
+                random module
+            age: int
+                Initial age, drawn at random when not given
+
         Returns
         -------
         None
@@ -35,7 +51,44 @@ class LivingBeing:
         # A new living being has to be alive..
         self._state = LivingBeingStateEnum.ALIVE.value
         self._life_points = 10
-        self._age = random.randint(0, 20)
+        if age is None:
+            age = (rng or random).randint(0, LIVING_BEING_MAX_AGE)
+        else:
+            self.check_age(age)
+        self._age = age
+
+    @staticmethod
+    def check_state(state: str) -> None:
+        """Raise a ValueError if the given state value is not valid."""
+        if not isinstance(state, str) or \
+                state not in LivingBeingStateEnum.values_set():
+            raise ValueError(
+                f"`state` should be a among the following values \
+                    {LivingBeingStateEnum.values_list()}."
+            )
+
+    @staticmethod
+    def check_life_points(life_points: int) -> None:
+        """Raise a ValueError if the given life_points value is not valid."""
+        if life_points is None or \
+                not isinstance(life_points, int) or life_points < 0:
+            raise ValueError("`life_points` should be a an integer value")
+
+    @staticmethod
+    def check_age(age: int) -> None:
+        """Raise a ValueError if the given age value is not valid."""
+        if not isinstance(age, int) or not 0 <= age <= LIVING_BEING_MAX_AGE:
+            raise ValueError("`age` should be an integer between 0 and 20.")
+
+    @classmethod
+    def check_dict(cls, data: dict) -> None:
+        """
+        Raise a ValueError if the given dict, as built by to_dict(), does
+        not describe a valid living being.
+        """
+        cls.check_state(data["_state"])
+        cls.check_life_points(data["_life_points"])
+        cls.check_age(data["_age"])
 
     @property
     def state(self) -> str:
@@ -61,14 +114,8 @@ class LivingBeing:
         -------
         None
         """
-        # Validate state value
-        if state is None or state not in LivingBeingStateEnum.values_list():
-            raise ValueError(
-                f"`state` should be a among the following values \
-                    {LivingBeingStateEnum.values_list()}."
-            )
-
-        self._state = state
+        self.check_state(state)
+        self._state = LivingBeingStateEnum.value_map()[state].value
 
     def set_life_points(self, life_points: int) -> None:
         """
@@ -82,11 +129,7 @@ class LivingBeing:
         -------
         None
         """
-        # Validate life_points value
-        if life_points is None or \
-                not isinstance(life_points, int) or life_points < 0:
-            raise ValueError("`life_points` should be a an integer value")
-
+        self.check_life_points(life_points)
         self._life_points = life_points
 
     def set_age(self, age: int) -> None:
@@ -101,12 +144,39 @@ class LivingBeing:
         -------
         None
         """
-        # Validate age value
-        if age is None or not isinstance(age, int) or age not in range(21):
-            raise ValueError("`age` should be an integer between 0 and 20.")
-
+        self.check_age(age)
         self._age = age
 
+    def to_dict(self) -> dict:
+        """
+        Return the living being attributes, keyed as in the config files.
+
+        Returns
+        -------
+        dict
+        """
+        return {
+            "_state": self.state,
+            "_life_points": self.life_points,
+            "_age": self.age,
+        }
+
+    def update_from_dict(self, data: dict) -> None:
+        """
+        Set the age, life points and state from a dict built by to_dict().
+
+        Parameters
+        ----------
+            data: dict
+
+        Returns
+        -------
+        None
+        """
+        self.set_age(data["_age"])
+        self.set_life_points(data["_life_points"])
+        self.set_state(data["_state"])
+
 
 class Animal(LivingBeing):
     """
@@ -118,7 +188,16 @@ class Animal(LivingBeing):
         Animal gender (male or female)
     """
 
-    def __init__(self, name: str, gender: str, specie: str) -> None:
+    __slots__ = ("_diet", "_gender", "_specie", "_name")
+
+    def __init__(
+        self,
+        name: str,
+        gender: str,
+        specie: str,
+        rng: random.Random = None,
+        age: int = None,
+    ) -> None:
         """
         Initialize the animal object with needed attributes.
 
@@ -127,46 +206,97 @@ class Animal(LivingBeing):
             name: str
             gender: str
             specie: str
+            rng: random.Random
+            age: int
 
         Returns
         -------
         None
         """
         # Initialize the parent LivingBeing object
-        super(Animal, self).__init__()
+        super(Animal, self).__init__(rng=rng, age=age)
 
-        # Validate name value
+        # Validate name, specie and gender values
+        self.check_name(name)
+        self.check_specie(specie)
+        self.check_gender(gender)
+
+        # Fetch the matching diet value
+        self._diet = ANIMAL_SPECIE_DIET_MAP[specie]
+
+        self._gender = genderEnum.value_map()[gender].value
+        self._specie = AnimalSpecieEnum.value_map()[specie].value
+        self._name = sys.intern(name)
+
+    @staticmethod
+    def check_name(name: str) -> None:
+        """Raise a ValueError if the given name value is not valid."""
         if name is None or not isinstance(name, str):
             raise ValueError("name should be a valid string.")
 
-        # Validate specie value
+    @staticmethod
+    def check_specie(specie: str) -> None:
+        """Raise a ValueError if the given specie value is not valid."""
         if (
             specie is None
             or not isinstance(specie, str)
-            or specie not in AnimalSpecieEnum.values_list()
+            or specie not in AnimalSpecieEnum.values_set()
         ):
             raise ValueError(
                 f"`specie` should be a among the following values \
                     {AnimalSpecieEnum.values_list()}."
             )
 
-        # Validate gender value received
+    @staticmethod
+    def check_gender(gender: str) -> None:
+        """Raise a ValueError if the given gender value is not valid."""
         if (
             gender is None
             or not isinstance(gender, str)
-            or gender not in genderEnum.values_list()
+            or gender not in genderEnum.values_set()
         ):
             raise ValueError("gender should be `male` or `female`")
 
-        # Fetch the matching diet value using the key in AnimalSpecieEnum
-        specie_key = AnimalSpecieEnum.names_list()[
-            AnimalSpecieEnum.values_list().index(specie)
-        ]
-        self._diet = AnimalSpecieDietEnum[specie_key].value
+    @classmethod
+    def check_dict(cls, data: dict) -> None:
+        """
+        Raise a ValueError if the given dict, as built by to_dict(), does
+        not describe a valid animal.
+        """
+        super(Animal, cls).check_dict(data)
+        cls.check_name(data["_name"])
+        cls.check_specie(data["_specie"])
+        cls.check_gender(data["_gender"])
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Animal":
+        """
+        Build an animal from a dict built by to_dict().
 
-        self._gender = gender
-        self._specie = specie
-        self._name = name
+        Parameters
+        ----------
+            data: dict
+
+        Returns
+        -------
+        Animal
+        """
+        animal = cls(
+            name=data["_name"],
+            gender=data["_gender"],
+            specie=data["_specie"],
+            age=data["_age"],
+        )
+        animal.update_from_dict(data)
+        return animal
+
+    def to_dict(self) -> dict:
+        data = super(Animal, self).to_dict()
+        data["_diet"] = self.diet
+        data["_gender"] = self.gender
+        data["_specie"] = self.specie
+        data["_name"] = self.name
+        return data
 
     @property
     def name(self) -> str:
@@ -192,34 +322,114 @@ class Plant(LivingBeing):
     Plant entity class. Inherits LivingBeing.
     """
 
-    def __init__(self, specie: str) -> None:
+    __slots__ = ("_specie",)
+
+    def __init__(
+        self, specie: str, rng: random.Random = None, age: int = None
+    ) -> None:
         """
         Initialize the plant object with needed attributes.
 
         Parameters
         ----------
             specie: str
+            rng: random.Random
+            age: int
 
         Returns
         -------
         None
         """
         # Initialize the parent LivingBeing object
-        super(Plant, self).__init__()
+        super(Plant, self).__init__(rng=rng, age=age)
 
         # Validate specie value
+        self.check_specie(specie)
+
+        self._specie = PlantspecieEnum.value_map()[specie].value
+
+    @staticmethod
+    def check_specie(specie: str) -> None:
+        """Raise a ValueError if the given specie value is not valid."""
         if (
             specie is None
             or not isinstance(specie, str)
-            or specie not in PlantspecieEnum.values_list()
+            or specie not in PlantspecieEnum.values_set()
         ):
             raise ValueError(
                 f"`specie` should be a among the following values \
                     {PlantspecieEnum.values_list()}."
             )
 
-        self._specie = specie
+    @classmethod
+    def check_dict(cls, data: dict) -> None:
+        """
+        Raise a ValueError if the given dict, as built by to_dict(), does
+        not describe a valid plant.
+        """
+        super(Plant, cls).check_dict(data)
+        cls.check_specie(data["_specie"])
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Plant":
+        """
+        Build a plant from a dict built by to_dict().
+
+        Parameters
+        ----------
+            data: dict
+
+        Returns
+        -------
+        Plant
+        """
+        plant = cls(specie=data["_specie"], age=data["_age"])
+        plant.update_from_dict(data)
+        return plant
+
+    def to_dict(self) -> dict:
+        data = super(Plant, self).to_dict()
+        data["_specie"] = self.specie
+        return data
 
     @property
     def specie(self) -> str:
         return self._specie
+
+
+def age_living_beings(
+    living_beings: List[LivingBeing], life_points_delta: int
+) -> List[LivingBeing]:
+    """
+    Make a whole population spend a day at once: its life points change by
+    `life_points_delta` and it gets one day older, unless it has reached the
+    maximum age in which case it dies.
+
+    Values are checked once for the whole population, then written without
+    going through the setters.
+
+    Parameters
+    ----------
+        living_beings: List[LivingBeing]
+        life_points_delta: int
+
+    Returns
+    -------
+    List[LivingBeing]
+        Living beings which died of old age, in the given order
+    """
+    if life_points_delta < 0 and any(
+        being._life_points + life_points_delta < 0
+        for being in living_beings
+    ):
+        raise ValueError("`life_points` should be a an integer value")
+
+    dead_of_old_age = []
+    for being in living_beings:
+        being._life_points += life_points_delta
+        if being._age == LIVING_BEING_MAX_AGE:
+            being._state = LivingBeingStateEnum.DEAD.value
+            dead_of_old_age.append(being)
+        else:
+            being._age += 1
+    return dead_of_old_age
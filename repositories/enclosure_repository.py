@@ -1,45 +1,276 @@
 """
 This class contains all the repository actions for our enclosure.
+
+Enclosures are saved either as yaml or as jsonl (one living being per
+line), depending on the file extension. Both formats are loaded as
+streams: living beings are built while the file is parsed, without
+materializing the whole document first.
 """
 
-import yaml
+import json
 import os
+from typing import IO, Iterator, Tuple
+
+import yaml
+from entities.columnar_enclosure import (
+    ANIMAL_SPECIE_CODES,
+    GENDER_CODES,
+    PLANT_SPECIE_CODES,
+    STATE_CODES,
+    ColumnarEnclosure,
+)
 from entities.enclosure import Enclosure
 from entities.living_being import Animal, Plant
-from utils import CONFIG_FILENAME
+from utils import CONFIG_FILENAME, SpecieTypeEnum
+
+JSONL_EXTENSIONS = (".jsonl",)
 
+# Sections of the yaml config files, with the kind of their living beings
+SECTION_KINDS = {
+    "animals": SpecieTypeEnum.ANIMAL.value,
+    "plants": SpecieTypeEnum.PLANT.value,
+}
 
-def save_enclosure_data_to_file(enclosure: Enclosure) -> None:
+NODE_START_EVENTS = (yaml.MappingStartEvent, yaml.SequenceStartEvent)
+NODE_END_EVENTS = (yaml.MappingEndEvent, yaml.SequenceEndEvent)
+
+
+def is_jsonl_path(path: str) -> bool:
+    """Tell whether the given path is a jsonl file."""
+    return os.path.splitext(path)[1].lower() in JSONL_EXTENSIONS
+
+
+def save_enclosure_data_to_file(
+    enclosure: Enclosure, path: str = CONFIG_FILENAME
+) -> None:
     """
-    Saves the given zoo content to a yaml file.
+    Saves the given zoo content to a yaml or jsonl file.
 
     Parameters
     ----------
         enclosure: Enclosure
+        path: data filepath, defaults to CONFIG_FILENAME
 
     Returns
     -------
     None
     """
+    if is_jsonl_path(path):
+        # One living being per line, written as they come
+        with open(f"{path}", "w") as f:
+            for kind, living_beings in [
+                (SpecieTypeEnum.ANIMAL.value, enclosure.get_animals()),
+                (SpecieTypeEnum.PLANT.value, enclosure.get_plants()),
+            ]:
+                for living_being in living_beings:
+                    f.write(
+                        json.dumps({"kind": kind, **living_being.to_dict()})
+                    )
+                    f.write("\n")
+        return
+
     data = {"animals": [], "plants": []}
     for animal in enclosure.get_animals():
-        data["animals"].append(vars(animal))
+        data["animals"].append(animal.to_dict())
     for plant in enclosure.get_plants():
-        data["plants"].append(vars(plant))
+        data["plants"].append(plant.to_dict())
 
     # Saving to file
     with open(
-        f"{CONFIG_FILENAME}",
+        f"{path}",
         "w",
     ) as f:
         yaml.dump(data, f, sort_keys=False)
 
 
+def _next_event(events: Iterator[yaml.Event]) -> yaml.Event:
+    """Return the next parsing event, failing on a truncated document."""
+    try:
+        return next(events)
+    except StopIteration:
+        raise ValueError("Unexpected end of document")
+
+
+def _expect_event(
+    events: Iterator[yaml.Event], event_class: type
+) -> yaml.Event:
+    """Return the next parsing event, failing if it is not as expected."""
+    event = _next_event(events)
+    if not isinstance(event, event_class):
+        raise ValueError(f"Unexpected {event} in document")
+    return event
+
+
+def _skip_node(events: Iterator[yaml.Event]) -> None:
+    """Consume the events of the next node, whatever its content."""
+    depth = 0
+    while True:
+        event = _next_event(events)
+        if isinstance(event, NODE_START_EVENTS):
+            depth += 1
+        elif isinstance(event, NODE_END_EVENTS):
+            depth -= 1
+        if depth == 0:
+            return
+
+
+def iter_yaml_records(stream: IO) -> Iterator[Tuple[str, dict]]:
+    """
+    Parse a yaml config file event by event, and yield its living beings
+    one at a time. Scalars are typed as yaml.safe_load would do.
+
+    Parameters
+    ----------
+        stream: IO
+
+    Returns
+    -------
+    Iterator[Tuple[str, dict]]
+        The kind (one of SpecieTypeEnum values) and the attributes of each
+        living being
+    """
+    resolver = yaml.resolver.Resolver()
+    constructor = yaml.constructor.SafeConstructor()
+
+    def construct_scalar(event: yaml.Event):
+        if not isinstance(event, yaml.ScalarEvent):
+            raise ValueError(f"Unexpected {event} in document")
+        tag = event.tag
+        if tag is None or tag == "!":
+            tag = resolver.resolve(
+                yaml.ScalarNode, event.value, event.implicit
+            )
+        node = yaml.ScalarNode(tag, event.value)
+        return constructor.yaml_constructors[tag](constructor, node)
+
+    events = yaml.parse(stream, Loader=yaml.SafeLoader)
+    _expect_event(events, yaml.StreamStartEvent)
+    _expect_event(events, yaml.DocumentStartEvent)
+    _expect_event(events, yaml.MappingStartEvent)
+
+    sections = set()
+    while True:
+        event = _next_event(events)
+        if isinstance(event, yaml.MappingEndEvent):
+            break
+        key = construct_scalar(event)
+        kind = SECTION_KINDS.get(key)
+        if kind is None:
+            _skip_node(events)
+            continue
+
+        sections.add(key)
+        _expect_event(events, yaml.SequenceStartEvent)
+        while True:
+            event = _next_event(events)
+            if isinstance(event, yaml.SequenceEndEvent):
+                break
+            if not isinstance(event, yaml.MappingStartEvent):
+                raise ValueError(f"Unexpected {event} in document")
+            record = {}
+            while True:
+                event = _next_event(events)
+                if isinstance(event, yaml.MappingEndEvent):
+                    break
+                record[construct_scalar(event)] = construct_scalar(
+                    _next_event(events)
+                )
+            yield kind, record
+
+    if sections != set(SECTION_KINDS):
+        raise ValueError("Missing section in document")
+
+
+def iter_jsonl_records(stream: IO) -> Iterator[Tuple[str, dict]]:
+    """
+    Parse a jsonl config file line by line, and yield its living beings
+    one at a time.
+
+    Parameters
+    ----------
+        stream: IO
+
+    Returns
+    -------
+    Iterator[Tuple[str, dict]]
+        The kind (one of SpecieTypeEnum values) and the attributes of each
+        living being
+    """
+    for line in stream:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        kind = record.pop("kind")
+        if kind not in SpecieTypeEnum.values_set():
+            raise ValueError(f"Unknown kind `{kind}`")
+        yield kind, record
+
+
+def load_records_into_enclosure(
+    enclosure: Enclosure, records: Iterator[Tuple[str, dict]]
+) -> Enclosure:
+    """
+    Replace the enclosure content by the given living beings. Columnar
+    enclosures get their rows appended straight to new columns, without
+    building any Animal or Plant object.
+
+    Parameters
+    ----------
+        enclosure: Enclosure
+        records: Iterator[Tuple[str, dict]]
+            As yielded by iter_yaml_records() or iter_jsonl_records()
+
+    Returns
+    -------
+    Enclosure
+    """
+    if isinstance(enclosure, ColumnarEnclosure):
+        animal_columns = enclosure.get_animal_columns().new()
+        plant_columns = enclosure.get_plant_columns().new()
+        for kind, data in records:
+            if kind == SpecieTypeEnum.ANIMAL.value:
+                Animal.check_dict(data)
+                animal_columns.append(
+                    specie=ANIMAL_SPECIE_CODES[data["_specie"]],
+                    age=data["_age"],
+                    life_points=data["_life_points"],
+                    state=STATE_CODES[data["_state"]],
+                    gender=GENDER_CODES[data["_gender"]],
+                    name=data["_name"],
+                )
+            else:
+                Plant.check_dict(data)
+                plant_columns.append(
+                    specie=PLANT_SPECIE_CODES[data["_specie"]],
+                    age=data["_age"],
+                    life_points=data["_life_points"],
+                    state=STATE_CODES[data["_state"]],
+                )
+
+        # Set the new content
+        enclosure.set_animal_columns(animal_columns)
+        enclosure.set_plant_columns(plant_columns)
+        return enclosure
+
+    animals_loaded = []
+    plants_loaded = []
+    for kind, data in records:
+        if kind == SpecieTypeEnum.ANIMAL.value:
+            animals_loaded.append(Animal.from_dict(data))
+        else:
+            plants_loaded.append(Plant.from_dict(data))
+
+    # Set the new content
+    enclosure.set_animals(animals=animals_loaded)
+    enclosure.set_plants(plants=plants_loaded)
+    return enclosure
+
+
 def load_enclosure_data_from_file(
         enclosure: Enclosure, path: str
 ) -> Enclosure:
     """
-    Saves the given zoo content to a yaml file.
+    Loads the given yaml or jsonl file content into the enclosure.
 
     Parameters
     ----------
@@ -50,38 +281,16 @@ def load_enclosure_data_from_file(
     -------
     Enclosure
     """
-    animals_loaded = []
-    plants_loaded = []
     # Check file config
-    if os.path.isfile(path):
-        with open(f"{path}", "r") as f:
-            output = yaml.safe_load(f)
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"There is no {path} file.")
+
+    with open(f"{path}", "r") as f:
+        records = (
+            iter_jsonl_records(f) if is_jsonl_path(path)
+            else iter_yaml_records(f)
+        )
         try:
-            for animal_data in output["animals"]:
-                animal = Animal(
-                    name=animal_data["_name"],
-                    gender=animal_data["_gender"],
-                    specie=animal_data["_specie"],
-                )
-                animal.set_age(animal_data["_age"])
-                animal.set_life_points(animal_data["_life_points"])
-                animal.set_state(animal_data["_state"])
-
-                animals_loaded.append(animal)
-            for plant_data in output["plants"]:
-                plant = Plant(specie=plant_data["_specie"])
-                plant.set_age(plant_data["_age"])
-                plant.set_life_points(plant_data["_life_points"])
-                plant.set_state(plant_data["_state"])
-
-                plants_loaded.append(plant)
+            return load_records_into_enclosure(enclosure, records)
         except Exception:
             raise ValueError("Config file format is wrong")
-
-        # Set the new content
-        enclosure.set_animals(animals=animals_loaded)
-        enclosure.set_plants(plants=plants_loaded)
-    else:
-        raise FileNotFoundError(f"There is no {path} file.")
-
-    return enclosure
@@ -2,12 +2,87 @@
 This class contains all the logic our enclosure.
 """
 
+from collections import deque
 from itertools import groupby
 import random
 from typing import List
+from entities.columnar_enclosure import (
+    AnimalView,
+    ColumnarEnclosure,
+    PlantView,
+    age_columns,
+)
 from entities.enclosure import Enclosure
-from entities.living_being import Animal, Plant
-from utils import DietEnum, LivingBeingStateEnum, genderEnum, log_to_file
+from entities.living_being import (
+    Animal,
+    LivingBeing,
+    Plant,
+    age_living_beings,
+)
+from services.event_service import emit_event
+from utils import (
+    DietEnum,
+    EventTypeEnum,
+    FeedingEngineEnum,
+    LivingBeingStateEnum,
+    SpecieTypeEnum,
+    genderEnum,
+    log_to_file,
+)
+
+
+def emit_meal_event(animal: Animal, food: LivingBeing) -> None:
+    """Publish the meal of an animal, before its LPs are updated."""
+    emit_event(
+        EventTypeEnum.MEAL.value,
+        name=animal.name,
+        specie=animal.specie,
+        life_points=animal.life_points,
+        food=food.specie,
+        food_kind=(
+            SpecieTypeEnum.ANIMAL.value if isinstance(food, Animal)
+            else SpecieTypeEnum.PLANT.value
+        ),
+    )
+
+
+def emit_death_by_hunger_event(animal: Animal) -> None:
+    """Publish the death of an animal which found nothing to eat."""
+    emit_event(
+        EventTypeEnum.DEATH_BY_HUNGER.value,
+        name=animal.name,
+        specie=animal.specie,
+        life_points=animal.life_points,
+    )
+
+
+def emit_death_by_predation_event(animal: Animal, eater: Animal) -> None:
+    """Publish the death of an animal which has been eaten."""
+    emit_event(
+        EventTypeEnum.DEATH_BY_PREDATION.value,
+        name=animal.name,
+        specie=animal.specie,
+        eater=eater.name,
+        eater_specie=eater.specie,
+    )
+
+
+def emit_death_by_age_event(living_being: LivingBeing) -> None:
+    """Publish the death of an animal or a plant of old age."""
+    if isinstance(living_being, Animal):
+        emit_event(
+            EventTypeEnum.DEATH_BY_AGE.value,
+            kind=SpecieTypeEnum.ANIMAL.value,
+            name=living_being.name,
+            gender=living_being.gender,
+            specie=living_being.specie,
+        )
+    else:
+        emit_event(
+            EventTypeEnum.DEATH_BY_AGE.value,
+            kind=SpecieTypeEnum.PLANT.value,
+            specie=living_being.specie,
+        )
 
 
 def report_enclosure_state(enclosure: Enclosure) -> str:
@@ -129,31 +204,29 @@ def get_first_eatable_animal_index_in_list(
     return None
 
 
-def let_animals_eat(enclosure: Enclosure) -> Enclosure:
+def feed_animals_legacy(animals: List[Animal], plants: List[Plant]) -> int:
     """
-    Trigger eat() action for each animal when it is possible
-    according to its diet
+    Feed the given animals using the original restart-from-zero loop.
+    Kept to compare outcomes with the queue based engine.
 
     Parameters
     ----------
-        enclosure: Enclosure
+        animals: List[Animal]
+        plants: List[Plant]
 
     Returns
     -------
-    Enclosure
+    int
+        Number of animals that died (hunger or had being eaten)
     """
-    # Get a shuffled list of animals
-    animals = enclosure.get_animals()
-    random.shuffle(animals)
     dead_animals_indexes = []
     already_fed_animals_indexes = []
 
-    plants = enclosure.get_plants()
-
-    # Loop until each animal eats
+    # Loop until each animal eats. An already fed animal may also get eaten
+    # afterwards, so handled animals are counted once.
     while len(
-            already_fed_animals_indexes + dead_animals_indexes
-            ) != len(animals):
+            set(already_fed_animals_indexes + dead_animals_indexes)
+            ) < len(animals):
         current_animal_idx = None
         curr_animal_food_idx = None
         for idx, animal in enumerate(animals):
@@ -175,21 +248,14 @@ def let_animals_eat(enclosure: Enclosure) -> Enclosure:
                 already_fed_animals_indexes.append(current_animal_idx)
                 continue
 
-            print(
-                f"{animal.name}, a {animal.specie} "
-                f"has {animal.life_points} LPs and is looking for food."
-            )
-
             # If its a canivorous, look for another animal to eat
             if animal.diet == DietEnum.CARNIVOROUS.value:
                 curr_animal_food_idx = get_first_eatable_animal_index_in_list(
                     animals=animals, exclude_idx=current_animal_idx
                 )
                 if curr_animal_food_idx is not None:
-                    print(
-                        f"It eats some "
-                        f"{animals[curr_animal_food_idx].specie} "
-                        f"and got 5 LP !"
+                    emit_meal_event(
+                        animal, animals[curr_animal_food_idx]
                     )
 
                     # Found some animals to eat. Update LPs
@@ -209,6 +275,9 @@ def let_animals_eat(enclosure: Enclosure) -> Enclosure:
                         animals[curr_animal_food_idx].set_state(
                             state=LivingBeingStateEnum.DEAD.value
                         )
+                        emit_death_by_predation_event(
+                            animals[curr_animal_food_idx], animal
+                        )
                         dead_animals_indexes.append(curr_animal_food_idx)
                     else:
                         animals[curr_animal_food_idx].set_life_points(
@@ -225,11 +294,7 @@ def let_animals_eat(enclosure: Enclosure) -> Enclosure:
                     plants=plants
                 )
                 if curr_animal_food_idx is not None:
-                    print(
-                        f"It eats some "
-                        f"{plants[curr_animal_food_idx].specie} "
-                        f"and got 4 more LP !"
-                    )
+                    emit_meal_event(animal, plants[curr_animal_food_idx])
 
                     # Found some plant to eat. Update LPs
                     # The eater gots 4 LP
@@ -258,21 +323,171 @@ def let_animals_eat(enclosure: Enclosure) -> Enclosure:
                     already_fed_animals_indexes.append(current_animal_idx)
                     break
             break
+        else:
+            # Nobody is left to feed (eg: dead animals were given), stop
+            break
 
         if curr_animal_food_idx is None and not skip:
             # If no food found, set it state to dead
-            print("It founds nothing to eat and dies...")
+            emit_death_by_hunger_event(animals[current_animal_idx])
             animals[current_animal_idx].set_state(
                 state=LivingBeingStateEnum.DEAD.value
             )
             dead_animals_indexes.append(current_animal_idx)
 
+    return len(dead_animals_indexes)
+
+
+def _pop_dead_heads(queue: deque, beings: list) -> None:
+    """Drop the leading positions of a queue pointing to dead beings."""
+    while queue and \
+            beings[queue[0]].state != LivingBeingStateEnum.ALIVE.value:
+        queue.popleft()
+
+
+def feed_animals_with_queues(
+    animals: List[Animal], plants: List[Plant]
+) -> int:
+    """
+    Feed the given animals in a single pass over the list.
+
+    Living preys are kept in per specie queues and living plants are
+    reached through a cursor. Since nothing comes back to life while
+    feeding, dead heads are dropped lazily and each position is visited
+    once, which makes the whole meal linear in the population size.
+
+    Every animal gets exactly one turn, in list order, and eats the first
+    living food in that order, like the legacy loop does.
+
+    Parameters
+    ----------
+        animals: List[Animal]
+        plants: List[Plant]
+
+    Returns
+    -------
+    int
+        Number of animals that died (hunger or had being eaten)
+    """
+    dead_animals_count = 0
+
+    # Group living preys positions by specie, keeping the list order
+    prey_queues = {}
+    for idx, animal in enumerate(animals):
+        if animal.state == LivingBeingStateEnum.ALIVE.value:
+            prey_queues.setdefault(animal.specie, deque()).append(idx)
+    plant_cursor = 0
+
+    for animal in animals:
+        # A dead animal can do nothing
+        if animal.state == LivingBeingStateEnum.DEAD.value:
+            continue
+
+        # If animal has more than 5 LP, then exit
+        if animal.life_points >= 5:
+            continue
+
+        found_food = False
+        # If its a canivorous, look for the first prey of another specie
+        if animal.diet == DietEnum.CARNIVOROUS.value:
+            food_idx = None
+            for specie, queue in prey_queues.items():
+                if specie == animal.specie:
+                    continue
+                _pop_dead_heads(queue, animals)
+                if queue and (food_idx is None or queue[0] < food_idx):
+                    food_idx = queue[0]
+
+            if food_idx is not None:
+                found_food = True
+                food = animals[food_idx]
+                emit_meal_event(animal, food)
+
+                # The eater gots 5 LP and the eaten looses 4LP
+                animal.set_life_points(life_points=animal.life_points + 5)
+                if food.life_points <= 4:
+                    # Less than 4LP left, the poor dies
+                    food.set_life_points(life_points=0)
+                    food.set_state(state=LivingBeingStateEnum.DEAD.value)
+                    emit_death_by_predation_event(food, animal)
+                    dead_animals_count += 1
+                else:
+                    food.set_life_points(life_points=food.life_points - 4)
+
+        # Herbivorous case, look for plants
+        elif animal.diet == DietEnum.HERBIVOROUS.value:
+            while plant_cursor < len(plants) and plants[plant_cursor].state \
+                    != LivingBeingStateEnum.ALIVE.value:
+                plant_cursor += 1
+
+            if plant_cursor < len(plants):
+                found_food = True
+                plant = plants[plant_cursor]
+                emit_meal_event(animal, plant)
+
+                # The eater gots 4 LP and the plant looses 2LP
+                animal.set_life_points(life_points=animal.life_points + 4)
+                if plant.life_points <= 2:
+                    # Less than 2LP left, the plant dies
+                    plant.set_life_points(life_points=0)
+                    plant.set_state(state=LivingBeingStateEnum.DEAD.value)
+                else:
+                    plant.set_life_points(life_points=plant.life_points - 2)
+
+        if not found_food:
+            # If no food found, set it state to dead
+            emit_death_by_hunger_event(animal)
+            animal.set_state(state=LivingBeingStateEnum.DEAD.value)
+            dead_animals_count += 1
+
+    return dead_animals_count
+
+
+FEEDING_ENGINES = {
+    FeedingEngineEnum.LEGACY.value: feed_animals_legacy,
+    FeedingEngineEnum.QUEUED.value: feed_animals_with_queues,
+}
+
+
+def let_animals_eat(
+    enclosure: Enclosure,
+    engine: str = FeedingEngineEnum.QUEUED.value,
+    rng: random.Random = None,
+) -> Enclosure:
+    """
+    Trigger eat() action for each animal when it is possible
+    according to its diet
+
+    Parameters
+    ----------
+        enclosure: Enclosure
+        engine: str
+            One of FeedingEngineEnum values, the legacy engine is kept to
+            compare results with the queue based one
+        rng: random.Random
+            Defaults to the enclosure generator
+
+    Returns
+    -------
+    Enclosure
+    """
+    if engine not in FEEDING_ENGINES:
+        raise ValueError(
+            f"`engine` should be among {FeedingEngineEnum.values_list()}"
+        )
+
+    # Get a shuffled list of animals
+    animals = enclosure.get_animals()
+    (rng or enclosure.get_rng()).shuffle(animals)
+    plants = enclosure.get_plants()
+
+    dead_animals_count = FEEDING_ENGINES[engine](animals, plants)
+
     # update the enclosure
     enclosure.set_animals(animals)
     enclosure.set_plants(plants)
-    print(
-        f"\n{len(dead_animals_indexes)} animal(s) died "
-        + "(hunger or had being eaten).\n\n"
+    emit_event(
+        EventTypeEnum.FEEDING_REPORT.value, dead_animals=dead_animals_count
     )
 
     # Remose those dead entities
@@ -310,7 +525,9 @@ def remove_dead_living_entities_from_enclosure(
     return enclosure
 
 
-def make_living_beings_spend_some_time(enclosure: Enclosure) -> Enclosure:
+def make_living_beings_spend_some_time(
+    enclosure: Enclosure, batched: bool = True
+) -> Enclosure:
     """
     Make all living beings in the enclosure spending some time. This affects
     their LP
@@ -318,11 +535,16 @@ def make_living_beings_spend_some_time(enclosure: Enclosure) -> Enclosure:
     Parameters
     ----------
         enclosure: Enclosure
+        batched: bool
+            Age the whole population at once instead of going through
+            each living being setters. Both give the same outcome.
 
     Returns
     -------
     Enclosure
     """
+    if batched:
+        return _make_living_beings_spend_some_time_batched(enclosure)
 
     # Get list of animals and plants
     animals = enclosure.get_animals()
@@ -332,7 +554,7 @@ def make_living_beings_spend_some_time(enclosure: Enclosure) -> Enclosure:
     for idx, plant in enumerate(plants):
         plants[idx].set_life_points(plant.life_points + 1)
         if plant.age == 20:
-            print(f"A {plant.specie} just died of old age.")
+            emit_death_by_age_event(plant)
             plants[idx].set_state(LivingBeingStateEnum.DEAD.value)
         else:
             plants[idx].set_age(plant.age + 1)
@@ -341,10 +563,7 @@ def make_living_beings_spend_some_time(enclosure: Enclosure) -> Enclosure:
     for idx, animal in enumerate(animals):
         animals[idx].set_life_points(animal.life_points - 1)
         if animal.age == 20:
-            print(
-                f"{animal.name}, a {animal.gender} {animal.specie} "
-                f"has died of old age."
-            )
+            emit_death_by_age_event(animal)
             animals[idx].set_state(LivingBeingStateEnum.DEAD.value)
         else:
             animals[idx].set_age(animal.age + 1)
@@ -354,18 +573,60 @@ def make_living_beings_spend_some_time(enclosure: Enclosure) -> Enclosure:
     return enclosure
 
 
-def make_living_beings_breed(enclosure: Enclosure) -> Enclosure:
+def _make_living_beings_spend_some_time_batched(
+    enclosure: Enclosure,
+) -> Enclosure:
+    """
+    Batched version of make_living_beings_spend_some_time: plants get 1 LP
+    and animals loose 1 LP all at once, and everyone gets older.
+    """
+    if isinstance(enclosure, ColumnarEnclosure):
+        animal_columns = enclosure.get_animal_columns()
+        plant_columns = enclosure.get_plant_columns()
+        # Check animals first so that nothing changes on failure
+        if len(animal_columns) and min(animal_columns.life_points) < 1:
+            raise ValueError("`life_points` should be a an integer value")
+
+        dead_plants = [
+            PlantView(plant_columns, idx)
+            for idx in age_columns(plant_columns, life_points_delta=1)
+        ]
+        dead_animals = [
+            AnimalView(animal_columns, idx)
+            for idx in age_columns(animal_columns, life_points_delta=-1)
+        ]
+    else:
+        animals = enclosure.get_animals()
+        if any(animal.life_points < 1 for animal in animals):
+            raise ValueError("`life_points` should be a an integer value")
+
+        dead_plants = age_living_beings(
+            enclosure.get_plants(), life_points_delta=1
+        )
+        dead_animals = age_living_beings(animals, life_points_delta=-1)
+
+    for living_being in dead_plants + dead_animals:
+        emit_death_by_age_event(living_being)
+    return enclosure
+
+
+def make_living_beings_breed(
+    enclosure: Enclosure, rng: random.Random = None
+) -> Enclosure:
     """
     Make capable living beings in the enclosure reproduce
 
     Parameters
     ----------
         enclosure: Enclosure
+        rng: random.Random
+            Defaults to the enclosure generator
 
     Returns
     -------
     Enclosure
     """
+    rng = rng or enclosure.get_rng()
     already_involved_animals_indexes = []
     newborn_animals = []
     new_plants = []
@@ -402,7 +663,7 @@ def make_living_beings_breed(enclosure: Enclosure) -> Enclosure:
                 already_involved_animals_indexes.append(mother)
 
                 # Create the newborn animal
-                newborn_gender = random.choice(genderEnum.values_list())
+                newborn_gender = rng.choice(genderEnum.values_tuple())
                 newborn_name = " jr"
                 if newborn_gender == genderEnum.FEMALE.value:
                     newborn_name = mother.name + newborn_name
@@ -412,15 +673,18 @@ def make_living_beings_breed(enclosure: Enclosure) -> Enclosure:
                 new_born = Animal(
                     name=newborn_name,
                     gender=newborn_gender,
-                    specie=father.specie
+                    specie=father.specie,
+                    rng=rng,
                 )
                 new_born.set_age(age=0)
                 newborn_animals.append(new_born)
-                print(
-                    f"\n{father.name} and {mother.name}, "
-                    f"two {father.specie}s had a new baby :"
-                    f"\n -> Welcome to {newborn_name}. "
-                    f"It's a {new_born.gender}"
+                emit_event(
+                    EventTypeEnum.BIRTH.value,
+                    father=father.name,
+                    mother=mother.name,
+                    specie=new_born.specie,
+                    name=new_born.name,
+                    gender=new_born.gender,
                 )
 
     # Look for plants with 10+ LPs
@@ -428,21 +692,28 @@ def make_living_beings_breed(enclosure: Enclosure) -> Enclosure:
     for idx, plant in enumerate(plants):
         if plant.life_points >= 10:
             # Create a new plant with half of this one LPs
-            new_baby_plant = Plant(specie=plant.specie)
+            new_baby_plant = Plant(specie=plant.specie, rng=rng)
             new_baby_plant.set_life_points(int(plant.life_points / 2))
             new_baby_plant.set_age(plant.age)
             new_plants.append(new_baby_plant)
 
             # Update the parent and reduce its LPs by half
             plants[idx].set_life_points(int(plant.life_points / 2))
-    print(f"\n{len(new_plants)} plant(s) reproduce to new ones !")
+    emit_event(
+        EventTypeEnum.PROPAGATION_REPORT.value, new_plants=len(new_plants)
+    )
     # Set new content of the enclosure
     enclosure.set_animals(animals=enclosure.get_animals() + newborn_animals)
     enclosure.set_plants(plants=plants + new_plants)
     return enclosure
 
 
-def move_forward_to_next_day(enclosure: Enclosure) -> Enclosure:
+def move_forward_to_next_day(
+    enclosure: Enclosure,
+    feeding_engine: str = FeedingEngineEnum.QUEUED.value,
+    batched_aging: bool = True,
+    rng: random.Random = None,
+) -> Enclosure:
     """
     Triggers all related actions needed for the biodiversity
     inside an enclosure.
@@ -450,6 +721,12 @@ def move_forward_to_next_day(enclosure: Enclosure) -> Enclosure:
     Parameters
         ----------
             enclosure: Enclosure
+            feeding_engine: str
+                One of FeedingEngineEnum values
+            batched_aging: bool
+                Age the whole population at once
+            rng: random.Random
+                Defaults to the enclosure generator
 
         Returns
         -------
@@ -457,17 +734,21 @@ def move_forward_to_next_day(enclosure: Enclosure) -> Enclosure:
     """
     # Animals and plants get affected by time moving
     enclosure = remove_dead_living_entities_from_enclosure(
-        make_living_beings_spend_some_time(enclosure=enclosure)
+        make_living_beings_spend_some_time(
+            enclosure=enclosure, batched=batched_aging
+        )
     )
 
     # We may have some nice surprises, let's see if there is new babies
     enclosure = remove_dead_living_entities_from_enclosure(
-        make_living_beings_breed(enclosure=enclosure)
+        make_living_beings_breed(enclosure=enclosure, rng=rng)
     )
 
     # Let's feed them. Or more precisely : Jungle's law
     enclosure = remove_dead_living_entities_from_enclosure(
-        let_animals_eat(enclosure=enclosure)
+        let_animals_eat(
+            enclosure=enclosure, engine=feeding_engine, rng=rng
+        )
     )
 
     return enclosure
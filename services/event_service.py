@@ -0,0 +1,209 @@
+"""
+This class contains the events publication logic of the simulation.
+
+Services publish structured events (meals, births, deaths...) to the
+current event sink, which decides what to do with them: print them, keep
+them in memory, write them to a file or simply drop them.
+"""
+
+import contextlib
+import json
+from typing import Iterator, List
+from utils import EventTypeEnum, SpecieTypeEnum
+
+
+class EventSink:
+    """
+    Base class of the event sinks.
+    """
+
+    def emit(self, event_type: str, data: dict) -> None:
+        """
+        Receive an event published by a service.
+
+        Parameters
+        ----------
+            event_type: str
+                One of EventTypeEnum values
+            data: dict
+                Event details
+
+        Returns
+        -------
+        None
+        """
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """Write any buffered event."""
+
+    def close(self) -> None:
+        """Release the resources held by the sink."""
+        self.flush()
+
+
+class NullEventSink(EventSink):
+    """Drop every event, for runs where nobody watches."""
+
+    def emit(self, event_type: str, data: dict) -> None:
+        pass
+
+
+class MemoryEventSink(EventSink):
+    """
+    Keep events in memory as dicts. When `max_events` is given, only the
+    most recent ones are kept.
+    """
+
+    def __init__(self, max_events: int = None) -> None:
+        if max_events is not None and \
+                (not isinstance(max_events, int) or max_events < 1):
+            raise ValueError("`max_events` should be a positive integer.")
+        self._max_events = max_events
+        self._events = []
+
+    def emit(self, event_type: str, data: dict) -> None:
+        self._events.append({"type": event_type, **data})
+        if self._max_events is not None and \
+                len(self._events) > 2 * self._max_events:
+            del self._events[: -self._max_events]
+
+    def get_events(self) -> List[dict]:
+        """Retrieve the events kept so far, oldest first."""
+        if self._max_events is not None:
+            del self._events[: -self._max_events]
+        return self._events
+
+    def clear(self) -> None:
+        """Forget all the events kept so far."""
+        self._events = []
+
+
+class JsonlEventSink(EventSink):
+    """
+    Write one JSON object per event and per line to a file.
+    """
+
+    def __init__(self, path: str, mode: str = "w") -> None:
+        if mode not in ["w", "a"]:
+            raise ValueError("`mode` should be `w` or `a`.")
+        self._file = open(path, mode)
+
+    def emit(self, event_type: str, data: dict) -> None:
+        self._file.write(json.dumps({"type": event_type, **data}))
+        self._file.write("\n")
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ConsoleEventSink(EventSink):
+    """
+    Print events the way the simulator has always narrated them.
+    """
+
+    def emit(self, event_type: str, data: dict) -> None:
+        message = format_event(event_type, data)
+        if message is not None:
+            print(message)
+
+
+def format_event(event_type: str, data: dict) -> str:
+    """
+    Return the human readable message of an event, or None when this kind
+    of event is not narrated.
+
+    Parameters
+    ----------
+        event_type: str
+        data: dict
+
+    Returns
+    -------
+    Union[str, None]
+    """
+    if event_type in [
+        EventTypeEnum.MEAL.value, EventTypeEnum.DEATH_BY_HUNGER.value
+    ]:
+        message = (
+            f"{data['name']}, a {data['specie']} "
+            f"has {data['life_points']} LPs and is looking for food.\n"
+        )
+        if event_type == EventTypeEnum.DEATH_BY_HUNGER.value:
+            return message + "It founds nothing to eat and dies..."
+        if data["food_kind"] == SpecieTypeEnum.ANIMAL.value:
+            return message + f"It eats some {data['food']} and got 5 LP !"
+        return message + f"It eats some {data['food']} and got 4 more LP !"
+
+    if event_type == EventTypeEnum.FEEDING_REPORT.value:
+        return (
+            f"\n{data['dead_animals']} animal(s) died "
+            + "(hunger or had being eaten).\n\n"
+        )
+
+    if event_type == EventTypeEnum.DEATH_BY_AGE.value:
+        if data["kind"] == SpecieTypeEnum.PLANT.value:
+            return f"A {data['specie']} just died of old age."
+        return (
+            f"{data['name']}, a {data['gender']} {data['specie']} "
+            f"has died of old age."
+        )
+
+    if event_type == EventTypeEnum.BIRTH.value:
+        return (
+            f"\n{data['father']} and {data['mother']}, "
+            f"two {data['specie']}s had a new baby :"
+            f"\n -> Welcome to {data['name']}. "
+            f"It's a {data['gender']}"
+        )
+
+    if event_type == EventTypeEnum.PROPAGATION_REPORT.value:
+        return f"\n{data['new_plants']} plant(s) reproduce to new ones !"
+
+    return None
+
+
+_event_sink = ConsoleEventSink()
+
+
+def get_event_sink() -> EventSink:
+    """Retrieve the sink receiving the events."""
+    return _event_sink
+
+
+def set_event_sink(sink: EventSink) -> None:
+    """
+    Set the sink receiving the events.
+
+    Parameters
+    ----------
+        sink: EventSink
+
+    Returns
+    -------
+    None
+    """
+    global _event_sink
+    if sink is None or not isinstance(sink, EventSink):
+        raise ValueError("`sink` should be an instance of EventSink.")
+    _event_sink = sink
+
+
+@contextlib.contextmanager
+def use_event_sink(sink: EventSink) -> Iterator[EventSink]:
+    """Set the sink receiving the events for the duration of a block."""
+    previous_sink = get_event_sink()
+    set_event_sink(sink)
+    try:
+        yield sink
+    finally:
+        sink.flush()
+        set_event_sink(previous_sink)
+
+
+def emit_event(event_type: str, **data) -> None:
+    """Publish an event to the current sink."""
+    _event_sink.emit(event_type, data)
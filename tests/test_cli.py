@@ -0,0 +1,81 @@
+import os
+
+import pytest
+from cli import main, run_simulation
+from entities.enclosure import Enclosure
+from entities.living_being import Animal, Plant
+from repositories.enclosure_repository import save_enclosure_data_to_file
+from utils import AnimalSpecieEnum, PlantspecieEnum, genderEnum
+
+
+def write_config(path: str) -> None:
+    enclosure = Enclosure()
+    for idx, specie in enumerate(AnimalSpecieEnum.values_list()):
+        for gender in genderEnum.values_list():
+            enclosure.add_animal(
+                Animal(name=f"Animal {idx}", gender=gender, specie=specie)
+            )
+    for _ in range(10):
+        enclosure.add_plant(Plant(specie=PlantspecieEnum.SEAWEED.value))
+    save_enclosure_data_to_file(enclosure=enclosure, path=path)
+
+
+def test_run_simulation_validation():
+    with pytest.raises(ValueError):
+        run_simulation(enclosure=Enclosure(), days=-1)
+
+    with pytest.raises(ValueError):
+        run_simulation(enclosure=Enclosure(), days=1, snapshot_every=None)
+
+
+def test_run_command(tmp_path, capsys):
+    config = str(tmp_path / "config.yaml")
+    write_config(config)
+
+    snapshots = []
+    for run in ["first", "second"]:
+        snapshot_dir = tmp_path / run
+        assert main(
+            [
+                "run",
+                "--config", config,
+                "--days", "5",
+                "--seed", "42",
+                "--snapshot-every", "2",
+                "--snapshot-dir", str(snapshot_dir),
+                "--quiet",
+            ]
+        ) == 0
+        assert sorted(os.listdir(snapshot_dir)) == [
+            "day-00000002.yaml", "day-00000004.yaml"
+        ]
+        snapshots.append((snapshot_dir / "day-00000004.yaml").read_text())
+
+    # Same seed, same run
+    assert snapshots[0] == snapshots[1]
+    out = capsys.readouterr().out
+    assert "looking for food" not in out
+    assert "days/s" in out
+
+    assert main(["run", "--config", "missing.yaml", "--days", "1"]) == 1
+
+
+def test_run_command_events_file(tmp_path):
+    config = str(tmp_path / "config.yaml")
+    events_file = tmp_path / "events.jsonl"
+    write_config(config)
+
+    assert main(
+        [
+            "run",
+            "--config", config,
+            "--days", "3",
+            "--events", "jsonl",
+            "--events-file", str(events_file),
+        ]
+    ) == 0
+    assert '"type": "feeding_report"' in events_file.read_text()
+
+    assert main(
+        ["run", "--config", config, "--days", "1", "--events", "jsonl"]
+    ) == 1
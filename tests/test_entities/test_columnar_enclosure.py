@@ -0,0 +1,162 @@
+import random
+
+import pytest
+from entities.columnar_enclosure import (
+    AnimalView,
+    ColumnarEnclosure,
+    PlantView,
+)
+from entities.enclosure import Enclosure
+from entities.living_being import Animal, Plant
+from services.enclosure_service import move_forward_to_next_day
+from utils import (
+    AnimalSpecieEnum,
+    DietEnum,
+    LivingBeingStateEnum,
+    PlantspecieEnum,
+    genderEnum,
+)
+
+
+def test_columnar_enclosure_entity():
+    enclosure = ColumnarEnclosure()
+
+    assert len(enclosure.get_animals()) == 0
+    assert len(enclosure.get_plants()) == 0
+
+    lion = Animal(
+        name="Black",
+        specie=AnimalSpecieEnum.LION.value,
+        gender=genderEnum.MALE.value
+    )
+    enclosure.add_animal(animal=lion)
+    enclosure.add_plant(plant=Plant(specie=PlantspecieEnum.SEAWEED.value))
+    enclosure.append_animal(
+        name="Black",
+        gender=genderEnum.FEMALE.value,
+        specie=AnimalSpecieEnum.GIRAFFE.value,
+        age=3,
+        life_points=7,
+        state=LivingBeingStateEnum.ALIVE.value,
+    )
+
+    with pytest.raises(ValueError):
+        enclosure.add_animal(animal=None)
+
+    with pytest.raises(ValueError):
+        enclosure.add_plant(plant=lion)
+
+    animals = enclosure.get_animals()
+    assert len(animals) == 2
+    assert len(enclosure.get_plants()) == 1
+    assert all(isinstance(animal, AnimalView) for animal in animals)
+    assert isinstance(enclosure.get_plants()[0], PlantView)
+
+    assert animals[0].name == "Black"
+    assert animals[0].age == lion.age
+    assert animals[0].diet == DietEnum.CARNIVOROUS.value
+    assert animals[1].specie == AnimalSpecieEnum.GIRAFFE.value
+    assert animals[1].gender == genderEnum.FEMALE.value
+    assert animals[1].diet == DietEnum.HERBIVOROUS.value
+    assert animals[1].life_points == 7
+
+    # Same names are stored once
+    assert len(enclosure.get_animal_columns().name_table) == 1
+
+
+def test_columnar_enclosure_views():
+    enclosure = ColumnarEnclosure()
+    enclosure.add_plant(plant=Plant(specie=PlantspecieEnum.SEAWEED.value))
+
+    # Writes go to the columns, and are validated
+    plant = enclosure.get_plants()[0]
+    plant.set_life_points(3)
+    plant.set_age(20)
+    plant.set_state(LivingBeingStateEnum.DEAD.value)
+    assert enclosure.get_plant_columns().life_points[0] == 3
+    assert enclosure.get_plants()[0].age == 20
+    assert enclosure.get_plants()[0].state == LivingBeingStateEnum.DEAD.value
+
+    with pytest.raises(ValueError):
+        plant.set_age(21)
+
+    with pytest.raises(ValueError):
+        plant.set_state("HALF_DEAD")
+
+
+def test_columnar_enclosure_set_animals():
+    enclosure = ColumnarEnclosure()
+    for name in ["Simba", "Nala", "Mufasa"]:
+        enclosure.add_animal(
+            Animal(
+                name=name,
+                specie=AnimalSpecieEnum.LION.value,
+                gender=genderEnum.MALE.value,
+            )
+        )
+    animals = enclosure.get_animals()
+    newborn = Animal(
+        name="Kiara",
+        specie=AnimalSpecieEnum.LION.value,
+        gender=genderEnum.FEMALE.value,
+    )
+
+    # Reorder, filter and mix views with plain objects
+    enclosure.set_animals([animals[2], animals[0], newborn])
+    assert [animal.name for animal in enclosure.get_animals()] == [
+        "Mufasa", "Simba", "Kiara"
+    ]
+
+    with pytest.raises(ValueError):
+        enclosure.set_animals([newborn, None])
+
+
+def test_columnar_enclosure_moving_forward_like_enclosure():
+    states = []
+    for enclosure_class in [Enclosure, ColumnarEnclosure]:
+        rng = random.Random(42)
+        enclosure = enclosure_class(rng=rng)
+        for idx in range(30):
+            enclosure.add_animal(
+                Animal(
+                    name=f"Animal {idx}",
+                    specie=rng.choice(AnimalSpecieEnum.values_list()),
+                    gender=rng.choice(genderEnum.values_list()),
+                    rng=rng,
+                )
+            )
+        for _ in range(20):
+            enclosure.add_plant(
+                Plant(specie=PlantspecieEnum.SEAWEED.value, rng=rng)
+            )
+
+        for _ in range(5):
+            enclosure = move_forward_to_next_day(enclosure)
+
+        states.append(
+            [
+                (animal.name, animal.age, animal.life_points)
+                for animal in enclosure.get_animals()
+            ]
+            + [
+                (plant.age, plant.life_points)
+                for plant in enclosure.get_plants()
+            ]
+        )
+
+    assert states[0] == states[1]
+
+
+def test_columnar_enclosure_from_enclosure():
+    enclosure = Enclosure()
+    enclosure.add_animal(
+        Animal(
+            name="Jimmy",
+            specie=AnimalSpecieEnum.GIRAFFE.value,
+            gender=genderEnum.MALE.value,
+        )
+    )
+    columnar = ColumnarEnclosure.from_enclosure(enclosure)
+    assert columnar.get_animals()[0].name == "Jimmy"
+    assert columnar.get_rng() is enclosure.get_rng()
+    assert len(columnar.get_plants()) == 0
@@ -1,6 +1,14 @@
+import random
+
+import pytest
 from entities.enclosure import Enclosure
 from entities.living_being import Animal, Plant
-from utils import AnimalSpecieEnum, PlantspecieEnum, genderEnum
+from utils import (
+    AnimalSpecieEnum,
+    PlantspecieEnum,
+    genderEnum,
+    split_rng,
+)
 
 
 def test_enclosure_entity():
@@ -33,3 +41,20 @@ def test_enclosure_entity():
 
     assert len(enclosure.get_animals()) == 3
     assert len(enclosure.get_plants()) == 1
+
+
+def test_enclosure_rng():
+    rng = random.Random(1)
+    enclosure = Enclosure(rng=rng)
+    assert enclosure.get_rng() is rng
+    assert isinstance(Enclosure().get_rng(), random.Random)
+
+    with pytest.raises(ValueError):
+        enclosure.set_rng(rng=42)
+
+    # Split streams are reproducible and independent
+    first_streams = split_rng(random.Random(1), 3)
+    second_streams = split_rng(random.Random(1), 3)
+    draws = [stream.random() for stream in first_streams]
+    assert draws == [stream.random() for stream in second_streams]
+    assert len(set(draws)) == 3
@@ -1,6 +1,10 @@
 import pytest
 from entities.living_being import Animal, LivingBeing, Plant
-from utils import AnimalSpecieEnum, LivingBeingStateEnum
+from utils import (
+    AnimalSpecieDietEnum,
+    AnimalSpecieEnum,
+    LivingBeingStateEnum,
+)
 
 
 def test_living_being_entity():
@@ -68,3 +72,52 @@ def test_plant_entity():
     # Create a plant, a check its name
     tulip = Plant(specie="seaweed")
     assert tulip.specie == "seaweed"
+
+
+def test_animal_diet():
+    for specie in AnimalSpecieEnum:
+        animal = Animal(name="Rex", gender="female", specie=specie.value)
+        assert animal.diet == AnimalSpecieDietEnum[specie.name].value
+
+    # Cached lookups are shared and can not be altered
+    assert AnimalSpecieEnum.values_set() is AnimalSpecieEnum.values_set()
+    assert AnimalSpecieEnum.value_map()["lion"] is AnimalSpecieEnum.LION
+    with pytest.raises(TypeError):
+        LivingBeingStateEnum.codes_map()["undead"] = 2
+
+    entity = LivingBeing()
+    with pytest.raises(ValueError):
+        entity.set_state(state=["alive"])
+
+    with pytest.raises(ValueError):
+        entity.set_age(age=21)
+
+
+def test_living_beings_to_dict():
+    lion = Animal(name="Simba", gender="male", specie="lion")
+    lion.set_life_points(3)
+    seaweed = Plant(specie="seaweed")
+    seaweed.set_state(state=LivingBeingStateEnum.DEAD.value)
+
+    # Compact entities do not carry a __dict__
+    assert not hasattr(lion, "__dict__")
+
+    assert lion.to_dict() == {
+        "_state": "alive",
+        "_life_points": 3,
+        "_age": lion.age,
+        "_diet": "carnivorous",
+        "_gender": "male",
+        "_specie": "lion",
+        "_name": "Simba",
+    }
+    copied_lion = Animal.from_dict(lion.to_dict())
+    assert copied_lion.to_dict() == lion.to_dict()
+    # Enum values are shared
+    assert copied_lion.specie is AnimalSpecieEnum.LION.value
+
+    copied_seaweed = Plant.from_dict(seaweed.to_dict())
+    assert copied_seaweed.to_dict() == seaweed.to_dict()
+
+    with pytest.raises(ValueError):
+        Plant.from_dict({**seaweed.to_dict(), "_age": 42})
@@ -0,0 +1,113 @@
+import io
+
+import pytest
+import yaml
+from entities.columnar_enclosure import ColumnarEnclosure
+from entities.enclosure import Enclosure
+from entities.living_being import Animal, Plant
+from repositories.enclosure_repository import (
+    iter_yaml_records,
+    load_enclosure_data_from_file,
+    save_enclosure_data_to_file,
+)
+from utils import (
+    CONFIG_FILENAME,
+    AnimalSpecieEnum,
+    LivingBeingStateEnum,
+    PlantspecieEnum,
+    genderEnum,
+)
+
+
+def get_enclosure(enclosure: Enclosure) -> Enclosure:
+    lion = Animal(
+        name="Simba",
+        specie=AnimalSpecieEnum.LION.value,
+        gender=genderEnum.MALE.value
+    )
+    lion.set_life_points(3)
+    seaweed = Plant(specie=PlantspecieEnum.SEAWEED.value)
+    seaweed.set_state(LivingBeingStateEnum.DEAD.value)
+    enclosure.add_animal(lion)
+    enclosure.add_plant(seaweed)
+    return enclosure
+
+
+def get_content(enclosure: Enclosure) -> list:
+    return [
+        being.to_dict()
+        for being in enclosure.get_animals() + enclosure.get_plants()
+    ]
+
+
+@pytest.mark.parametrize("enclosure_class", [Enclosure, ColumnarEnclosure])
+def test_save_and_load_enclosure(tmp_path, monkeypatch, enclosure_class):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+
+    enclosure = get_enclosure(enclosure_class())
+    save_enclosure_data_to_file(enclosure=enclosure)
+
+    loaded = load_enclosure_data_from_file(
+        enclosure=enclosure_class(), path=CONFIG_FILENAME
+    )
+    assert get_content(loaded) == get_content(enclosure)
+
+
+def test_load_enclosure_errors(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_enclosure_data_from_file(
+            enclosure=Enclosure(), path=str(tmp_path / "missing.yaml")
+        )
+
+    path = tmp_path / "wrong.yaml"
+    path.write_text("animals:\n  - _name: Simba\n")
+    with pytest.raises(ValueError):
+        load_enclosure_data_from_file(enclosure=Enclosure(), path=str(path))
+
+
+@pytest.mark.parametrize("enclosure_class", [Enclosure, ColumnarEnclosure])
+def test_save_and_load_enclosure_jsonl(tmp_path, enclosure_class):
+    path = str(tmp_path / "enclosure.jsonl")
+    enclosure = get_enclosure(enclosure_class())
+    save_enclosure_data_to_file(enclosure=enclosure, path=path)
+    assert len(open(path).readlines()) == 2
+
+    # Formats can be mixed with backends
+    for loaded_class in [Enclosure, ColumnarEnclosure]:
+        loaded = load_enclosure_data_from_file(
+            enclosure=loaded_class(), path=path
+        )
+        assert get_content(loaded) == get_content(enclosure)
+
+
+def test_iter_yaml_records():
+    content = (
+        "version: {format: [1, 2]}\n"
+        "animals:\n"
+        "- {_state: alive, _life_points: 0x3, _age: 2, _diet: carnivorous,"
+        " _gender: male, _specie: lion, _name: '007'}\n"
+        "plants: []\n"
+    )
+    records = list(iter_yaml_records(io.StringIO(content)))
+    expected = yaml.safe_load(content)
+    assert records == [("animal", expected["animals"][0])]
+
+    with pytest.raises(ValueError):
+        list(iter_yaml_records(io.StringIO("animals: []\n")))
+
+
+def test_load_enclosure_errors_keep_content(tmp_path):
+    enclosure = get_enclosure(ColumnarEnclosure())
+    content = get_content(enclosure)
+
+    path = tmp_path / "wrong.jsonl"
+    path.write_text(
+        '{"kind": "plant", "_state": "alive", "_life_points": 3, '
+        '"_age": 2, "_specie": "seaweed"}\n'
+        '{"kind": "plant", "_state": "alive", "_life_points": -1, '
+        '"_age": 2, "_specie": "seaweed"}\n'
+    )
+    with pytest.raises(ValueError):
+        load_enclosure_data_from_file(enclosure=enclosure, path=str(path))
+    assert get_content(enclosure) == content
@@ -2,17 +2,26 @@
 This class contains all the logic our enclosure.
 """
 
+import random
+
+import pytest
+from entities.columnar_enclosure import ColumnarEnclosure
 from entities.enclosure import Enclosure
 from entities.living_being import Animal, Plant
 from services.enclosure_service import (
+    FEEDING_ENGINES,
+    feed_animals_legacy,
+    feed_animals_with_queues,
     get_first_living_plant_index_in_list,
     let_animals_eat,
     make_living_beings_breed,
     make_living_beings_spend_some_time,
+    move_forward_to_next_day,
     remove_dead_living_entities_from_enclosure,
 )
 from utils import (
     AnimalSpecieEnum,
+    FeedingEngineEnum,
     LivingBeingStateEnum,
     PlantspecieEnum,
     genderEnum
@@ -100,6 +109,126 @@ def test_let_animals_eat():
     assert enclosure.get_plants()[0].life_points in [6, 8]
 
 
+def get_hungry_animals_and_plants():
+    giraffe = Animal(
+        name="Jimmy",
+        specie=AnimalSpecieEnum.GIRAFFE.value,
+        gender=genderEnum.MALE.value,
+    )
+    lion = Animal(
+        name="Simba",
+        specie=AnimalSpecieEnum.LION.value,
+        gender=genderEnum.MALE.value
+    )
+    tiger = Animal(
+        name="Flash",
+        specie=AnimalSpecieEnum.TIGER.value,
+        gender=genderEnum.FEMALE.value,
+    )
+    antelope = Animal(
+        name="Bambi",
+        specie=AnimalSpecieEnum.ANTELOPE.value,
+        gender=genderEnum.FEMALE.value,
+    )
+    seaweed = Plant(specie=PlantspecieEnum.SEAWEED.value)
+
+    giraffe.set_life_points(3)
+    lion.set_life_points(2)
+    tiger.set_life_points(1)
+    antelope.set_life_points(3)
+    seaweed.set_life_points(5)
+    return [lion, giraffe, tiger, antelope], [seaweed]
+
+
+def test_feeding_engines_give_the_same_outcome():
+    legacy_animals, legacy_plants = get_hungry_animals_and_plants()
+    queued_animals, queued_plants = get_hungry_animals_and_plants()
+
+    assert feed_animals_legacy(
+        legacy_animals, legacy_plants
+    ) == feed_animals_with_queues(queued_animals, queued_plants) == 1
+
+    for legacy, queued in zip(
+        legacy_animals + legacy_plants, queued_animals + queued_plants
+    ):
+        assert legacy.state == queued.state
+        assert legacy.life_points == queued.life_points
+
+    # The lion eats the giraffe, which is too weak to survive
+    assert [animal.life_points for animal in queued_animals] == [3, 0, 6, 7]
+    assert queued_animals[1].state == LivingBeingStateEnum.DEAD.value
+    assert queued_plants[0].life_points == 3
+
+
+def get_random_enclosure(seed: int) -> Enclosure:
+    rng = random.Random(seed)
+    enclosure = Enclosure(rng=rng)
+    for idx in range(rng.randint(1, 30)):
+        animal = Animal(
+            name=f"Animal {idx}",
+            specie=rng.choice(AnimalSpecieEnum.values_list()),
+            gender=rng.choice(genderEnum.values_list()),
+            rng=rng,
+        )
+        animal.set_life_points(rng.randint(1, 10))
+        enclosure.add_animal(animal)
+    for _ in range(rng.randint(0, 10)):
+        plant = Plant(specie=PlantspecieEnum.SEAWEED.value, rng=rng)
+        plant.set_life_points(rng.randint(1, 12))
+        enclosure.add_plant(plant)
+    return enclosure
+
+
+def test_feeding_engines_give_the_same_outcome_for_a_seed():
+    for seed in range(200):
+        outcomes = []
+        for engine in FeedingEngineEnum.values_list():
+            enclosure = get_random_enclosure(seed)
+            animals = list(enclosure.get_animals())
+            plants = list(enclosure.get_plants())
+            let_animals_eat(enclosure=enclosure, engine=engine)
+            outcomes.append(
+                [(being.state, being.life_points)
+                 for being in animals + plants]
+            )
+        assert outcomes[0] == outcomes[1]
+
+
+def test_feeding_carnivorous_only():
+    for engine in FeedingEngineEnum.values_list():
+        lions = []
+        for name in ["Simba", "Nala"]:
+            lion = Animal(
+                name=name,
+                specie=AnimalSpecieEnum.LION.value,
+                gender=genderEnum.MALE.value
+            )
+            lion.set_life_points(2)
+            lions.append(lion)
+
+        # No other specie to eat, they both starve
+        assert FEEDING_ENGINES[engine](lions, []) == 2
+        assert all(
+            lion.state == LivingBeingStateEnum.DEAD.value for lion in lions
+        )
+
+
+def test_let_animals_eat_engine_validation():
+    with pytest.raises(ValueError):
+        let_animals_eat(enclosure=Enclosure(), engine="fastest")
+
+    # Herbivorous only, so that the legacy loop never miscounts
+    enclosure = Enclosure()
+    animals, plants = get_hungry_animals_and_plants()
+    enclosure.set_animals([animals[1], animals[3]])
+    enclosure.set_plants(plants)
+    enclosure = let_animals_eat(
+        enclosure=enclosure, engine=FeedingEngineEnum.LEGACY.value
+    )
+    assert len(enclosure.get_animals()) == 2
+    assert enclosure.get_plants()[0].life_points == 1
+
+
 def test_make_living_beings_spend_some_time():
     enclosure = Enclosure()
     lion = Animal(
@@ -129,6 +258,74 @@ def test_make_living_beings_spend_some_time():
     assert enclosure.get_animals()[1].state == LivingBeingStateEnum.DEAD.value
 
 
+def test_make_living_beings_spend_some_time_batched(capsys):
+    outcomes = []
+    for enclosure_class in [Enclosure, ColumnarEnclosure]:
+        for batched in [False, True]:
+            enclosure = enclosure_class()
+            enclosure.set_animals(get_random_enclosure(7).get_animals())
+            enclosure.set_plants(get_random_enclosure(7).get_plants())
+            enclosure.get_animals()[0].set_age(20)
+            enclosure.get_plants()[0].set_age(20)
+            capsys.readouterr()
+
+            enclosure = make_living_beings_spend_some_time(
+                enclosure, batched=batched
+            )
+            outcomes.append(
+                (
+                    [
+                        (being.state, being.age, being.life_points)
+                        for being in enclosure.get_animals()
+                        + enclosure.get_plants()
+                    ],
+                    capsys.readouterr().out,
+                )
+            )
+
+    assert "died of old age" in outcomes[0][1]
+    assert all(outcome == outcomes[0] for outcome in outcomes)
+
+    # An animal can not go below 0 LP, nothing is changed then
+    for enclosure_class in [Enclosure, ColumnarEnclosure]:
+        enclosure = enclosure_class()
+        enclosure.add_plant(Plant(specie=PlantspecieEnum.SEAWEED.value))
+        enclosure.add_animal(
+            Animal(
+                name="Simba",
+                specie=AnimalSpecieEnum.LION.value,
+                gender=genderEnum.MALE.value
+            )
+        )
+        enclosure.get_animals()[0].set_life_points(0)
+        with pytest.raises(ValueError):
+            make_living_beings_spend_some_time(enclosure, batched=True)
+        assert enclosure.get_plants()[0].life_points == 10
+
+
+def test_move_forward_to_next_day_is_reproducible():
+    states = []
+    for _ in range(2):
+        enclosure = get_random_enclosure(3)
+        for _ in range(5):
+            enclosure = move_forward_to_next_day(enclosure)
+        states.append(
+            [
+                being.to_dict()
+                for being in enclosure.get_animals() + enclosure.get_plants()
+            ]
+        )
+    assert states[0] == states[1]
+
+    # An explicit generator wins over the enclosure one
+    enclosure = get_random_enclosure(3)
+    move_forward_to_next_day(enclosure, rng=random.Random(4))
+    assert [
+        being.to_dict()
+        for being in enclosure.get_animals() + enclosure.get_plants()
+    ] != states[0]
+
+
 def test_make_living_beings_breed() -> None:
     enclosure = Enclosure()
     enclosure.add_animal(
@@ -0,0 +1,107 @@
+import json
+
+import pytest
+from entities.enclosure import Enclosure
+from entities.living_being import Animal, Plant
+from services.enclosure_service import (
+    let_animals_eat,
+    make_living_beings_spend_some_time,
+)
+from services.event_service import (
+    ConsoleEventSink,
+    JsonlEventSink,
+    MemoryEventSink,
+    NullEventSink,
+    emit_event,
+    get_event_sink,
+    set_event_sink,
+    use_event_sink,
+)
+from utils import (
+    AnimalSpecieEnum,
+    EventTypeEnum,
+    PlantspecieEnum,
+    genderEnum,
+)
+
+
+def get_enclosure() -> Enclosure:
+    enclosure = Enclosure()
+    giraffe = Animal(
+        name="Jimmy",
+        specie=AnimalSpecieEnum.GIRAFFE.value,
+        gender=genderEnum.MALE.value,
+    )
+    giraffe.set_life_points(3)
+    giraffe.set_age(20)
+    enclosure.add_animal(giraffe)
+    enclosure.add_plant(Plant(specie=PlantspecieEnum.SEAWEED.value))
+    return enclosure
+
+
+def test_memory_event_sink():
+    with use_event_sink(MemoryEventSink()) as sink:
+        enclosure = let_animals_eat(enclosure=get_enclosure())
+        make_living_beings_spend_some_time(enclosure)
+
+    assert sink.get_events() == [
+        {
+            "type": EventTypeEnum.MEAL.value,
+            "name": "Jimmy",
+            "specie": "giraffe",
+            "life_points": 3,
+            "food": "seaweed",
+            "food_kind": "plant",
+        },
+        {"type": EventTypeEnum.FEEDING_REPORT.value, "dead_animals": 0},
+        {
+            "type": EventTypeEnum.DEATH_BY_AGE.value,
+            "kind": "animal",
+            "name": "Jimmy",
+            "gender": "male",
+            "specie": "giraffe",
+        },
+    ]
+
+    sink = MemoryEventSink(max_events=2)
+    for idx in range(5):
+        sink.emit(EventTypeEnum.FEEDING_REPORT.value, {"dead_animals": idx})
+    assert [event["dead_animals"] for event in sink.get_events()] == [3, 4]
+    sink.clear()
+    assert sink.get_events() == []
+
+    with pytest.raises(ValueError):
+        MemoryEventSink(max_events=0)
+
+
+def test_console_event_sink(capsys):
+    with use_event_sink(ConsoleEventSink()):
+        let_animals_eat(enclosure=get_enclosure())
+
+    assert capsys.readouterr().out == (
+        "Jimmy, a giraffe has 3 LPs and is looking for food.\n"
+        "It eats some seaweed and got 4 more LP !\n"
+        "\n0 animal(s) died (hunger or had being eaten).\n\n\n"
+    )
+
+
+def test_null_and_jsonl_event_sinks(tmp_path, capsys):
+    previous_sink = get_event_sink()
+    with use_event_sink(NullEventSink()):
+        let_animals_eat(enclosure=get_enclosure())
+    assert capsys.readouterr().out == ""
+    assert get_event_sink() is previous_sink
+
+    path = tmp_path / "events.jsonl"
+    sink = JsonlEventSink(path=str(path))
+    with use_event_sink(sink):
+        emit_event(EventTypeEnum.FEEDING_REPORT.value, dead_animals=2)
+        emit_event(EventTypeEnum.PROPAGATION_REPORT.value, new_plants=1)
+    sink.close()
+    lines = path.read_text().splitlines()
+    assert [json.loads(line)["type"] for line in lines] == [
+        "feeding_report", "propagation_report"
+    ]
+
+    with pytest.raises(ValueError):
+        set_event_sink(None)
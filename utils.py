@@ -2,10 +2,17 @@
 
 import os
 import datetime
+import hashlib
+import random
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List
 
 CONFIG_FILENAME = "data/config.yaml"
 LOG_REPORT_PATH = "log_reports/report.txt"
+# Living beings die of old age once they reach this age
+LIVING_BEING_MAX_AGE = 20
 
 
 def log_to_file(content: str):
@@ -23,17 +30,88 @@ def log_to_file(content: str):
         )
 
 
+def split_rng(rng: random.Random, count: int) -> List[random.Random]:
+    """
+    Derive `count` independent random generators from the given one. The
+    derived generators only depend on the state of `rng`, which advances.
+
+    Parameters
+    ----------
+        rng: random.Random
+        count: int
+
+    Returns
+    -------
+    List[random.Random]
+    """
+    if count is None or not isinstance(count, int) or count < 0:
+        raise ValueError("`count` should be a positive integer.")
+    return [random.Random(rng.getrandbits(128)) for _ in range(count)]
+
+
+def derive_seed(seed: int, *keys: int) -> int:
+    """
+    Derive a seed from a root seed and some keys (eg: a replica and a day
+    number), so that each combination gets its own independent stream
+    whatever the order in which they are used.
+
+    Parameters
+    ----------
+        seed: int
+        keys: int
+
+    Returns
+    -------
+    int
+    """
+    digest = hashlib.sha256(
+        ":".join(str(value) for value in (seed, *keys)).encode()
+    ).digest()
+    return int.from_bytes(digest[:16], "big")
+
+
 class ExtendedEnum(Enum):
-    """Customized enum class."""
+    """
+    Customized enum class.
+
+    Lookups used by validation paths are computed once per enum and cached,
+    hence returned as immutable objects.
+    """
 
     @classmethod
     def values_list(cls):
-        return list(map(lambda c: c.value, cls))
+        return list(cls.values_tuple())
 
     @classmethod
     def names_list(cls):
         return list(map(lambda c: c.name, cls))
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def values_tuple(cls):
+        """Return the enum values, in declaration order."""
+        return tuple(c.value for c in cls)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def values_set(cls):
+        """Return the enum values as a frozenset, for membership checks."""
+        return frozenset(cls.values_tuple())
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def value_map(cls):
+        """Map each value to its enum member."""
+        return MappingProxyType({c.value: c for c in cls})
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def codes_map(cls):
+        """Map each value to a small integer code, its declaration rank."""
+        return MappingProxyType(
+            {c.value: code for code, c in enumerate(cls)}
+        )
+
 
 class LivingBeingStateEnum(ExtendedEnum):
     ALIVE = "alive"
@@ -68,6 +146,15 @@ class AnimalSpecieDietEnum(ExtendedEnum):
     GIRAFFE = DietEnum.HERBIVOROUS.value
 
 
+# Diet value of each animal specie value
+ANIMAL_SPECIE_DIET_MAP = MappingProxyType(
+    {
+        specie.value: AnimalSpecieDietEnum[specie.name].value
+        for specie in AnimalSpecieEnum
+    }
+)
+
+
 class PlantspecieEnum(ExtendedEnum):
     SEAWEED = "seaweed"
 
@@ -75,3 +162,18 @@ class PlantspecieEnum(ExtendedEnum):
 class SpecieTypeEnum(ExtendedEnum):
     ANIMAL = "animal"
     PLANT = "plant"
+
+
+class FeedingEngineEnum(ExtendedEnum):
+    LEGACY = "legacy"
+    QUEUED = "queued"
+
+
+class EventTypeEnum(ExtendedEnum):
+    MEAL = "meal"
+    BIRTH = "birth"
+    DEATH_BY_AGE = "death_by_age"
+    DEATH_BY_HUNGER = "death_by_hunger"
+    DEATH_BY_PREDATION = "death_by_predation"
+    FEEDING_REPORT = "feeding_report"
+    PROPAGATION_REPORT = "propagation_report"